@@ -0,0 +1,61 @@
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+from vcti.app.insights import app_context
+from vcti.app.insights.app import app
+from vcti.wtf.template.repository import TemplatesRepository
+
+
+@pytest.fixture
+def client(tmp_path):
+    template = tmp_path / "repo" / "tmpl"
+    (template / "source" / "root").mkdir(parents=True)
+    (template / "source" / ".entrypoint").write_text("root\n")
+    (template / "source" / "root" / "meta.yaml").write_text("title: Test\n")
+    (template / "data" / "nested" / "deeper").mkdir(parents=True)
+    (template / "data" / "empty").mkdir()
+    (template / "data" / "a.txt").write_text("hello")
+    (template / "data" / "nested" / "b.bin").write_bytes(b"\0" * 1234)
+    (template / "data" / "nested" / "deeper" / "c.yaml").write_text("x: 1\n")
+
+    repo = TemplatesRepository(local_repo_path=tmp_path / "repo")
+    app.dependency_overrides[app_context.templates_repository] = lambda: repo
+    yield TestClient(app)
+    app.dependency_overrides.pop(app_context.templates_repository, None)
+
+
+def _nest(records):
+    """Nests streamed directory records into the file-tree response layout."""
+    by_path = {record["path"]: record for record in records}
+
+    def expand(node):
+        if node["type"] != "directory":
+            return node
+        children = [expand(child) for child in by_path[node["path"]]["children"]]
+        return {**node, "children": sorted(children, key=lambda c: c["name"])}
+
+    return expand(records[0])["children"]
+
+
+def _sorted(nodes):
+    return sorted(
+        (
+            {**node, "children": _sorted(node["children"])} if "children" in node else node
+            for node in nodes
+        ),
+        key=lambda node: node["name"],
+    )
+
+
+@pytest.mark.parametrize("file_path", ["data", "data/nested", "source"])
+def test_file_tree_stream_matches_file_tree(client, file_path):
+    stream = client.get(f"/api/fs/tmpl/{file_path}", params={"mode": "file-tree-stream"})
+    tree = client.get(f"/api/fs/tmpl/{file_path}", params={"mode": "file-tree"})
+
+    assert stream.status_code == 200 and tree.status_code == 200
+    assert stream.headers["content-type"] == "application/x-ndjson"
+    assert stream.content.endswith(b"\n")
+    records = [orjson.loads(line) for line in stream.content.splitlines()]
+    assert records[0]["path"] == f"tmpl/{file_path}"
+    assert _nest(records) == _sorted(tree.json())
@@ -0,0 +1,36 @@
+import os
+
+import pytest
+
+from vcti.app.insights.api.utils import create_unique_file_name
+
+
+def test_unique_file_names_are_distinct_and_fixed_length():
+    names = [create_unique_file_name() for _ in range(10000)]
+
+    assert len(set(names)) == len(names)
+    assert {len(name) for name in names} == {19}
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_forked_children_do_not_repeat_names():
+    read_fd, write_fd = os.pipe()
+    children = []
+    for _ in range(2):
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            names = ",".join(create_unique_file_name() for _ in range(3))
+            os.write(write_fd, f"{names}\n".encode())
+            os._exit(0)
+        children.append(pid)
+    os.close(write_fd)
+    for pid in children:
+        os.waitpid(pid, 0)
+    with os.fdopen(read_fd) as pipe:
+        lines = pipe.read().split()
+
+    parent_names = {create_unique_file_name()[11:] for _ in range(3)}
+    first, second = ({name[11:] for name in line.split(",")} for line in lines)
+    assert not first & second
+    assert not (first | second) & parent_names
@@ -0,0 +1,69 @@
+import io
+import os
+import zipfile
+
+import pytest
+
+from vcti.archive.directory_zip_streamer import (
+    COMPRESSED_SUFFIXES,
+    DirectoryZipStreamer,
+)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "tree"
+    (root / "nested" / "deeper").mkdir(parents=True)
+    (root / "empty").mkdir()
+    files = {
+        "readme.txt": b"hello " * 1000,
+        "nested/data.csv": b"a,b,c\n" * 5000,
+        "nested/deeper/blob.bin": os.urandom(300000),
+        "nested/image.PNG": os.urandom(2048),
+        "archive.zip": os.urandom(1024),
+        "empty.txt": b"",
+    }
+    for name, data in files.items():
+        (root / name).write_bytes(data)
+    return root, files
+
+
+def test_stream_roundtrip(tree):
+    root, files = tree
+    chunks = list(DirectoryZipStreamer(root, chunk_size=4096))
+
+    assert len(chunks) > 1
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as zip_file:
+        assert zip_file.testzip() is None
+        assert sorted(zip_file.namelist()) == sorted(files)
+        for name, data in files.items():
+            info = zip_file.getinfo(name)
+            assert zip_file.read(name) == data
+            assert info.file_size == len(data)
+            suffix = os.path.splitext(name)[1].lower()
+            expected = (
+                zipfile.ZIP_STORED
+                if suffix in COMPRESSED_SUFFIXES
+                else zipfile.ZIP_DEFLATED
+            )
+            assert info.compress_type == expected
+
+
+def test_stream_keeps_modes_and_times(tree):
+    root, _ = tree
+    script = root / "nested" / "run.sh"
+    script.write_bytes(b"#!/bin/sh\n")
+    script.chmod(0o751)
+    os.utime(script, (1700000000, 1700000000))
+
+    data = b"".join(DirectoryZipStreamer(root))
+    with zipfile.ZipFile(io.BytesIO(data)) as zip_file:
+        info = zip_file.getinfo("nested/run.sh")
+
+    assert (info.external_attr >> 16) & 0o777 == 0o751
+    assert info.date_time[0] == 2023
+
+
+def test_rejects_missing_directory(tmp_path):
+    with pytest.raises(ValueError):
+        DirectoryZipStreamer(tmp_path / "missing")
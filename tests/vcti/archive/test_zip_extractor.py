@@ -0,0 +1,97 @@
+import io
+import os
+import zipfile
+
+import pytest
+from fastapi import UploadFile
+
+from vcti.archive import zip_extractor
+from vcti.archive.zip_extractor import ZipExtractor
+
+
+class _NonSeekable(io.RawIOBase):
+    """Read-only stream without seek support, like a network body."""
+
+    def __init__(self, data: bytes):
+        self._source = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return False
+
+    def readinto(self, buffer):
+        return self._source.readinto(buffer)
+
+
+def _make_zip(members) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        for name, data in members.items():
+            zip_file.writestr(name, data)
+    return buffer.getvalue()
+
+
+def _extracted_files(root):
+    return {
+        os.path.relpath(os.path.join(dir_path, name), root).replace(os.sep, "/")
+        for dir_path, _, names in os.walk(root)
+        for name in names
+    }
+
+
+@pytest.mark.parametrize("seekable", [True, False])
+def test_extract_streaming_stays_in_target(tmp_path, seekable):
+    target = tmp_path / "sandbox" / "target"
+    target.mkdir(parents=True)
+    data = _make_zip(
+        {
+            "../x": b"parent",
+            "/abs/x": b"absolute",
+            "a\\..\\..\\x": b"backslash",
+            "C:x": b"drive",
+            "ok/file.txt": b"fine",
+        }
+    )
+    source = io.BytesIO(data) if seekable else _NonSeekable(data)
+
+    ZipExtractor(UploadFile(file=source), target).extract_streaming()
+
+    assert _extracted_files(tmp_path) == {
+        "sandbox/target/x",
+        "sandbox/target/abs/x",
+        "sandbox/target/a/x",
+        "sandbox/target/ok/file.txt",
+    }
+    assert (target / "ok" / "file.txt").read_bytes() == b"fine"
+
+
+def test_member_path_drops_everything_unsafe(tmp_path):
+    extractor = ZipExtractor(UploadFile(file=io.BytesIO()), tmp_path)
+
+    assert extractor._member_path("../..") is None
+    assert extractor._member_path("C:") is None
+    assert extractor._member_path("C:/x") == tmp_path / "x"
+    assert extractor._member_path("./a//b/") == tmp_path / "a" / "b"
+
+
+def test_extract_streaming_writes_full_entries(tmp_path, monkeypatch):
+    # A small shared buffer makes every entry span several reads
+    monkeypatch.setattr(zip_extractor, "COPY_BUFFER_SIZE", 1000)
+    members = {
+        "empty.bin": b"",
+        "short.bin": b"abc",
+        "exact.bin": os.urandom(1000),
+        "long.bin": os.urandom(2500),
+        "dir/later.bin": b"z" * 999,
+    }
+
+    ZipExtractor(
+        UploadFile(file=io.BytesIO(_make_zip(members))), tmp_path
+    ).extract_streaming()
+
+    for name, data in members.items():
+        written = (tmp_path / name).read_bytes()
+        assert len(written) == len(data)
+        assert written == data
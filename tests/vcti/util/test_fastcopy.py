@@ -0,0 +1,207 @@
+import errno
+import io
+import os
+import shutil
+from tempfile import SpooledTemporaryFile
+
+import pytest
+
+from vcti.util import fastcopy
+from vcti.util.fastcopy import (
+    _backing_fileno,
+    clone_file,
+    copy_path,
+    copy_stream_to_file,
+    reflink_tree,
+)
+
+
+def _fail(err):
+    def call(*args, **kwargs):
+        raise OSError(err, os.strerror(err))
+
+    return call
+
+
+def _spy(monkeypatch, owner, name, calls):
+    original = getattr(owner, name)
+
+    def call(*args, **kwargs):
+        calls.append(name)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(owner, name, call)
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    path = tmp_path / "source.bin"
+    # Larger than one copy chunk so every method loops
+    path.write_bytes(os.urandom(fastcopy.COPY_BUFSIZE + 12345))
+    path.chmod(0o640)
+    return path
+
+
+def _assert_same_file(source, target):
+    assert target.read_bytes() == source.read_bytes()
+    assert target.stat().st_mode == source.stat().st_mode
+
+
+@pytest.mark.skipif(fastcopy.fcntl is None, reason="FICLONE needs fcntl")
+def test_clone_file_falls_back_to_copy_file_range(tmp_path, source_file, monkeypatch):
+    calls = []
+    monkeypatch.setattr(fastcopy.fcntl, "ioctl", _fail(errno.EOPNOTSUPP))
+    _spy(monkeypatch, os, "copy_file_range", calls)
+    _spy(monkeypatch, os, "sendfile", calls)
+
+    target = tmp_path / "target.bin"
+    clone_file(source_file, target)
+
+    assert set(calls) == {"copy_file_range"}
+    _assert_same_file(source_file, target)
+
+
+def test_clone_file_falls_back_to_sendfile(tmp_path, source_file, monkeypatch):
+    calls = []
+    if fastcopy.fcntl is not None:
+        monkeypatch.setattr(fastcopy.fcntl, "ioctl", _fail(errno.EOPNOTSUPP))
+    monkeypatch.setattr(os, "copy_file_range", _fail(errno.EXDEV), raising=False)
+    _spy(monkeypatch, os, "sendfile", calls)
+
+    target = tmp_path / "target.bin"
+    clone_file(source_file, target)
+
+    assert set(calls) == {"sendfile"}
+    _assert_same_file(source_file, target)
+
+
+def test_clone_file_falls_back_to_copyfileobj(tmp_path, source_file, monkeypatch):
+    calls = []
+    if fastcopy.fcntl is not None:
+        monkeypatch.setattr(fastcopy.fcntl, "ioctl", _fail(errno.EOPNOTSUPP))
+    monkeypatch.setattr(os, "copy_file_range", _fail(errno.EXDEV), raising=False)
+    monkeypatch.setattr(os, "sendfile", _fail(errno.ENOSYS), raising=False)
+    _spy(monkeypatch, shutil, "copyfileobj", calls)
+
+    target = tmp_path / "target.bin"
+    clone_file(source_file, target)
+
+    assert calls == ["copyfileobj"]
+    _assert_same_file(source_file, target)
+
+
+def test_clone_file_refuses_existing_target(tmp_path, source_file):
+    target = tmp_path / "target.bin"
+    target.write_bytes(b"keep")
+
+    with pytest.raises(FileExistsError):
+        clone_file(source_file, target)
+    assert target.read_bytes() == b"keep"
+
+
+def test_reflink_tree_preserves_tree(tmp_path, monkeypatch):
+    if fastcopy.fcntl is not None:
+        monkeypatch.setattr(fastcopy.fcntl, "ioctl", _fail(errno.EOPNOTSUPP))
+    source = tmp_path / "source"
+    (source / "nested" / "deeper").mkdir(parents=True)
+    (source / "empty").mkdir()
+    (source / "top.txt").write_text("top")
+    (source / "nested" / "run.sh").write_text("#!/bin/sh\n")
+    (source / "nested" / "run.sh").chmod(0o755)
+    (source / "nested" / "deeper" / "data.bin").write_bytes(os.urandom(4096))
+
+    target = tmp_path / "target"
+    copy_path(source, target)
+
+    def snapshot(root):
+        return {
+            str(path.relative_to(root)): (
+                path.stat().st_mode,
+                None if path.is_dir() else path.read_bytes(),
+            )
+            for path in root.rglob("*")
+        }
+
+    assert snapshot(target) == snapshot(source)
+    with pytest.raises(FileExistsError):
+        reflink_tree(source, target)
+
+
+@pytest.mark.parametrize("rolled", [False, True])
+def test_copy_stream_to_file_from_spool(tmp_path, rolled):
+    data = os.urandom(3 * 4096)
+    with SpooledTemporaryFile(max_size=1 << 20) as spool:
+        spool.write(data)
+        if rolled:
+            spool.rollover()
+
+        fileno = _backing_fileno(spool)
+        assert (fileno is not None) is rolled
+        # Asking for the descriptor must not move an in-memory spool to disk
+        assert spool._rolled is rolled
+
+        target = tmp_path / "target.bin"
+        target.write_bytes(b"stale contents that are longer than nothing")
+        copy_stream_to_file(spool, target)
+
+    assert target.read_bytes() == data
+
+
+def test_backing_fileno_of_plain_streams(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"x")
+
+    with open(path, "rb") as file:
+        assert _backing_fileno(file) == file.fileno()
+    assert _backing_fileno(io.BytesIO(b"x")) is None
+
+
+def _stop_after_first_chunk(real_copy):
+    """Wraps a kernel copy so that it reports end of file after one call."""
+    calls = []
+
+    def call(*args):
+        calls.append(args)
+        return real_copy(*args) if len(calls) == 1 else 0
+
+    return call
+
+
+def test_clone_file_finishes_a_short_kernel_copy(tmp_path, source_file, monkeypatch):
+    if fastcopy.fcntl is not None:
+        monkeypatch.setattr(fastcopy.fcntl, "ioctl", _fail(errno.EOPNOTSUPP))
+    monkeypatch.setattr(
+        os, "copy_file_range", _stop_after_first_chunk(os.copy_file_range)
+    )
+
+    target = tmp_path / "target.bin"
+    clone_file(source_file, target)
+
+    _assert_same_file(source_file, target)
+
+
+def test_clone_file_finishes_a_short_sendfile(tmp_path, source_file, monkeypatch):
+    if fastcopy.fcntl is not None:
+        monkeypatch.setattr(fastcopy.fcntl, "ioctl", _fail(errno.EOPNOTSUPP))
+    monkeypatch.setattr(os, "copy_file_range", _fail(errno.EXDEV), raising=False)
+    monkeypatch.setattr(os, "sendfile", _stop_after_first_chunk(os.sendfile))
+
+    target = tmp_path / "target.bin"
+    clone_file(source_file, target)
+
+    _assert_same_file(source_file, target)
+
+
+def test_copy_stream_to_file_finishes_a_short_kernel_copy(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        os, "copy_file_range", _stop_after_first_chunk(os.copy_file_range)
+    )
+    data = os.urandom(fastcopy.COPY_BUFSIZE + 4321)
+    with SpooledTemporaryFile(max_size=1024) as spool:
+        spool.write(data)
+        assert spool._rolled
+
+        target = tmp_path / "target.bin"
+        copy_stream_to_file(spool, target)
+
+    assert target.read_bytes() == data
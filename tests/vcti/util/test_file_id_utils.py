@@ -0,0 +1,83 @@
+import pytest
+
+from vcti.util.file_id_utils import FileId
+
+
+@pytest.mark.parametrize(
+    "file_id",
+    [
+        "a",
+        "file.txt",
+        "a/b/c.txt",
+        "a/b/",
+        "a/b//",
+        ".hidden/file",
+        "a/.../b",
+        "a/..b",
+        "dir name/file name.txt",
+        "naïve/ünïcode",
+    ],
+)
+def test_accepts_valid_file_ids(file_id):
+    assert FileId.is_valid(file_id)
+
+
+@pytest.mark.parametrize(
+    "file_id",
+    [
+        "",
+        " ",
+        "\t",
+        "/",
+        "//",
+        "/a",
+        "./a",
+        "../a",
+        ".",
+        "..",
+        "a/.",
+        "a/..",
+        "a/./b",
+        "a/../b",
+        "a//b",
+        "a/ /b",
+        "a/\t/b",
+        "a\\b",
+        "C:/a",
+        *(f"dir/bad{char}name" for char in '<>:"\\|?*'),
+    ],
+)
+def test_rejects_invalid_file_ids(file_id):
+    assert not FileId.is_valid(file_id)
+
+
+@pytest.mark.parametrize("parent", ["", "a", "a/b c"])
+@pytest.mark.parametrize(
+    "name, is_dir",
+    [
+        ("file.txt", False),
+        ("sub dir", True),
+        ("100% #1 naïve.txt", False),
+        (".hidden", True),
+        ("a..b", False),
+    ],
+)
+def test_compose_matches_file_id_of_resolved_path(tmp_path, parent, name, is_dir):
+    parent_dir = tmp_path / parent
+    parent_dir.mkdir(parents=True, exist_ok=True)
+    parent_id = FileId.get_file_id(parent_dir, tmp_path)
+
+    path = FileId.resolve_path(FileId.compose(parent_id, name, is_dir), tmp_path)
+    if is_dir:
+        path.mkdir()
+    else:
+        path.touch()
+
+    assert path == parent_dir / name
+    assert FileId.compose(parent_id, name, is_dir) == FileId.get_file_id(path, tmp_path)
+
+
+@pytest.mark.parametrize("name", ["", ".", "..", "a/b", "a\\b", "bad:name"])
+def test_compose_rejects_invalid_names(name):
+    with pytest.raises(ValueError):
+        FileId.compose("a", name)
@@ -0,0 +1,46 @@
+import pytest
+
+from vcti.util.filename_validator import FileNameValidator
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "file.txt",
+        "a",
+        ".hidden",
+        "...",
+        "..a",
+        "a..",
+        " leading",
+        "trailing ",
+        "a b",
+        "naïve",
+        "-_+=,;'!@#$%^&()[]{}~`",
+    ],
+)
+def test_accepts_valid_names(name):
+    assert FileNameValidator.is_valid(name)
+    FileNameValidator.validate(name)
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "",
+        " ",
+        "\t",
+        " \n ",
+        "\u3000",
+        ".",
+        "..",
+        *'<>:"/\\|?*',
+        *(f"bad{char}name" for char in '<>:"/\\|?*'),
+        "name/",
+        "/name",
+    ],
+)
+def test_rejects_invalid_names(name):
+    assert not FileNameValidator.is_valid(name)
+    with pytest.raises(ValueError):
+        FileNameValidator.validate(name)
@@ -0,0 +1,67 @@
+import pytest
+from git import Repo
+
+from vcti.util.git_repository_manager import GitRepositoryManager
+
+
+@pytest.fixture
+def remote_repo(tmp_path):
+    """A local repository with two commits and several top-level directories."""
+    repo_dir = tmp_path / "remote"
+    repo = Repo.init(repo_dir)
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "test")
+        config.set_value("user", "email", "test@example.com")
+
+    files = [
+        "README.md",
+        "templates/a/source/entrypoint.yaml",
+        "templates/b/source/entrypoint.yaml",
+        "other/data.txt",
+        "docs/guide/index.md",
+    ]
+    for name in files:
+        path = repo_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(name)
+    repo.index.add(files)
+    repo.index.commit("initial")
+
+    (repo_dir / "README.md").write_text("updated")
+    repo.index.add(["README.md"])
+    repo.index.commit("update")
+    return repo_dir
+
+
+def checked_out_files(repo_dir):
+    return sorted(
+        path.relative_to(repo_dir).as_posix()
+        for path in repo_dir.rglob("*")
+        if path.is_file() and ".git" not in path.relative_to(repo_dir).parts
+    )
+
+
+def test_sparse_clone_checks_out_only_the_cone(remote_repo, tmp_path):
+    local_dir = tmp_path / "local"
+    manager = GitRepositoryManager(local_dir)
+
+    manager.create_from_remote(
+        remote_repo.as_uri(), depth=1, sparse_paths=["templates/a", "docs"]
+    )
+
+    # Cone mode also checks out the files at the top level
+    assert checked_out_files(local_dir) == [
+        "README.md",
+        "docs/guide/index.md",
+        "templates/a/source/entrypoint.yaml",
+    ]
+    assert (local_dir / "README.md").read_text() == "updated"
+    assert Repo(local_dir).git.rev_list("--count", "HEAD") == "1"
+
+
+def test_clone_without_sparse_paths_checks_out_everything(remote_repo, tmp_path):
+    local_dir = tmp_path / "local"
+
+    GitRepositoryManager(local_dir).create_from_remote(remote_repo.as_uri())
+
+    assert checked_out_files(local_dir) == checked_out_files(remote_repo)
@@ -0,0 +1,58 @@
+import orjson
+import pytest
+
+from vcti.util.path_tree import get_path_tree_data, iter_path_tree
+
+
+def rebuild_tree(records):
+    """Nests streamed directory records into a get_path_tree_data style tree."""
+    by_path = {record["path"]: record for record in records}
+
+    def expand(node):
+        if node["type"] != "directory":
+            return node
+        record = by_path[node["path"]]
+        children = [expand(child) for child in record["children"]]
+        return {**node, "children": sorted(children, key=lambda c: c["name"])}
+
+    return expand(records[0])
+
+
+def sort_tree(node):
+    if "children" in node:
+        node["children"] = sorted(
+            (sort_tree(child) for child in node["children"]),
+            key=lambda child: child["name"],
+        )
+    return node
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "template" / "data"
+    (root / "nested" / "deeper").mkdir(parents=True)
+    (root / "empty").mkdir()
+    (root / "a.txt").write_text("hello")
+    (root / "nested" / "b.bin").write_bytes(b"\0" * 1234)
+    (root / "nested" / "deeper" / "c.yaml").write_text("x: 1\n")
+    (root / "with space.txt").write_text("")
+    return root
+
+
+def test_stream_records_rebuild_the_full_tree(tree):
+    base = tree.parent.parent
+    lines = [
+        orjson.dumps(record) + b"\n"
+        for record in iter_path_tree(tree, base_path=base, as_posix=True)
+    ]
+    records = [orjson.loads(line) for line in lines]
+
+    assert len(records) == 4  # data, empty, nested, nested/deeper
+    expected = orjson.loads(
+        orjson.dumps(get_path_tree_data(tree, base_path=base, as_posix=True))
+    )
+    assert rebuild_tree(records) == sort_tree(expected[0])
+
+
+def test_stream_of_a_file_is_empty(tree):
+    assert list(iter_path_tree(tree / "a.txt")) == []
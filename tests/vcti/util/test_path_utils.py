@@ -0,0 +1,45 @@
+import pytest
+
+from vcti.util import path_utils
+from vcti.util.path_utils import (
+    invalidate_folder_access,
+    validate_folder_access_cached,
+)
+
+
+@pytest.fixture
+def folders(tmp_path, monkeypatch):
+    monkeypatch.setattr(path_utils, "_validated_folders", {})
+    paths = []
+    for index in range(6):
+        path = tmp_path / str(index)
+        path.mkdir()
+        paths.append(str(path))
+    return paths
+
+
+def test_cached_folder_checks_are_bounded(folders, monkeypatch):
+    monkeypatch.setattr(path_utils, "FOLDER_ACCESS_CACHE_SIZE", 3)
+
+    for path in folders:
+        validate_folder_access_cached(path)
+
+    assert list(path_utils._validated_folders) == folders[3:]
+
+
+def test_expired_folder_checks_are_pruned(folders):
+    for path in folders[:3]:
+        validate_folder_access_cached(path)
+    validate_folder_access_cached(folders[3], ttl=0.0)
+
+    assert list(path_utils._validated_folders) == [folders[3]]
+
+
+def test_cached_folder_check_is_reused_until_invalidated(folders, tmp_path):
+    validate_folder_access_cached(folders[0])
+    (tmp_path / "0").rmdir()
+    validate_folder_access_cached(folders[0])
+
+    invalidate_folder_access(folders[0])
+    with pytest.raises(FileNotFoundError):
+        validate_folder_access_cached(folders[0])
@@ -0,0 +1,46 @@
+import pytest
+
+from vcti.wtf import yaml_reader
+from vcti.wtf.template import repository
+from vcti.wtf.template.repository import TemplatesRepository
+
+
+def _make_template(root, name, valid=True):
+    node_dir = root / name / "source" / "main"
+    node_dir.mkdir(parents=True)
+    (node_dir / "meta.yaml").write_text(f"title: {name}\n")
+    if valid:
+        (root / name / "source" / ".entrypoint").write_text("main\n")
+
+
+@pytest.fixture
+def repo_dir(tmp_path, monkeypatch):
+    yaml_reader.clear_cache()
+    monkeypatch.setattr(repository, "_listing_executor", None)
+    for index in range(4):
+        _make_template(tmp_path, f"valid_{index}")
+    _make_template(tmp_path, "no_entrypoint", valid=False)
+    (tmp_path / "not_a_template").mkdir()
+    (tmp_path / ".git").mkdir()
+    yield tmp_path
+    yaml_reader.clear_cache()
+
+
+def test_list_templates_filters_invalid_directories(repo_dir):
+    repo = TemplatesRepository(repo_dir)
+
+    names = sorted(template.id for template in repo.list_templates())
+
+    assert names == [f"valid_{index}" for index in range(4)]
+
+
+def test_listing_executor_is_created_on_first_use(repo_dir):
+    repo = TemplatesRepository(repo_dir)
+    assert repository._listing_executor is None
+
+    list(repo.list_templates())
+
+    executor = repository._listing_executor
+    assert executor is not None
+    list(repo.list_templates())
+    assert repository._listing_executor is executor
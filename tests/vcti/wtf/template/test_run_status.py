@@ -0,0 +1,49 @@
+import pytest
+
+from vcti.wtf.template import run_status
+from vcti.wtf.template.run_status import (
+    _RUN_STATUS_ADAPTER,
+    RunState,
+    RunStatus,
+    RunStatusManager,
+    _dump_status,
+)
+
+
+def test_status_roundtrip(tmp_path):
+    manager = RunStatusManager(tmp_path)
+    assert manager.load() == RunStatus()
+
+    status = RunStatus(state=RunState.RUNNING, pid=42, message='quote " and\nnewline')
+    manager.save(status)
+
+    assert manager.load() == status
+    assert RunStatus.model_validate_json(manager.status_file.read_bytes()) == status
+
+
+def test_status_cache_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(run_status, "STATUS_CACHE_SIZE", 3)
+    monkeypatch.setattr(run_status, "_status_cache", type(run_status._status_cache)())
+
+    managers = [RunStatusManager(tmp_path / f"run_{i}") for i in range(6)]
+    for index, manager in enumerate(managers):
+        manager.run_dir.mkdir()
+        manager.save(RunStatus(state=RunState.COMPLETED, pid=index))
+        assert manager.load().pid == index
+
+    assert list(run_status._status_cache) == [m._status_path for m in managers[3:]]
+    # Evicted entries are read from disk again
+    assert managers[0].load().pid == 0
+
+
+@pytest.mark.parametrize(
+    "status",
+    [
+        RunStatus(),
+        RunStatus(state=RunState.RUNNING, pid=0),
+        RunStatus(state=RunState.FAILED, pid=123, message='a"b\\c\n\t'),
+        RunStatus(state=RunState.FAILED, message="\x00\x1f\x7f   😀 ünï"),
+    ],
+)
+def test_dump_status_matches_model_serializer(status):
+    assert _dump_status(status) == _RUN_STATUS_ADAPTER.dump_json(status, indent=2)
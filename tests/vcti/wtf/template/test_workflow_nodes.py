@@ -0,0 +1,33 @@
+import pytest
+
+from vcti.wtf import yaml_reader
+from vcti.wtf.template.workflow_nodes import WorkflowNodes
+
+
+@pytest.fixture
+def template(tmp_path):
+    yaml_reader.clear_cache()
+    node_dir = tmp_path / "source" / "main"
+    node_dir.mkdir(parents=True)
+    (tmp_path / "source" / ".entrypoint").write_text("main\n")
+    yield tmp_path
+    yaml_reader.clear_cache()
+
+
+def test_missing_node_files_load_as_empty(template):
+    nodes = WorkflowNodes(template)
+
+    assert nodes.root_node == "main"
+    assert nodes.node_metadata("main") is None
+    assert nodes.node_variables("main").root == []
+
+
+def test_node_files_created_later_are_loaded(template):
+    nodes = WorkflowNodes(template)
+    assert nodes.node_variables("main").root == []
+
+    (template / "source" / "main" / "variables.yaml").write_text(
+        "- {name: alpha, type: string, default: a}\n"
+    )
+
+    assert [v.name for v in nodes.node_variables("main").root] == ["alpha"]
@@ -0,0 +1,173 @@
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+from typing import List
+
+import pytest
+from pydantic import BaseModel
+
+from vcti.wtf import yaml_reader
+from vcti.wtf.env_vars import EnvVar
+from vcti.wtf.template.metadata import Metadata
+from vcti.wtf.variable.list import Variables
+from vcti.wtf.yaml_reader import clear_cache, load_yaml, read_model, root_locator
+
+
+class _Record(BaseModel):
+    id: int
+    items: List[str]
+
+
+@pytest.fixture
+def yaml_files(tmp_path):
+    clear_cache()
+    paths = []
+    for index in range(12):
+        path = tmp_path / f"file_{index}.yaml"
+        path.write_text(f"id: {index}\nitems: [a, b, c]\n")
+        paths.append(path)
+    yield paths
+    clear_cache()
+
+
+def test_load_yaml_returns_copies(yaml_files):
+    first = load_yaml(yaml_files[0])
+    first["items"].append("d")
+
+    assert load_yaml(yaml_files[0]) == {"id": 0, "items": ["a", "b", "c"]}
+
+
+def test_load_yaml_concurrent_with_eviction(yaml_files, monkeypatch):
+    # A cache smaller than the working set keeps entries being evicted
+    # while other threads look them up
+    monkeypatch.setattr(yaml_reader, "YAML_CACHE_SIZE", 3)
+
+    def load_all(round_index):
+        for offset in range(len(yaml_files) * 4):
+            index = (round_index + offset) % len(yaml_files)
+            assert load_yaml(yaml_files[index])["id"] == index
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        for future in [executor.submit(load_all, i) for i in range(16)]:
+            future.result()
+
+    assert len(yaml_reader._yaml_cache) <= 3
+
+
+@pytest.fixture
+def variables_file(tmp_path):
+    clear_cache()
+    path = tmp_path / "variables.yaml"
+    path.write_text(
+        "- {name: alpha, type: string, default: a}\n"
+        "- {name: beta, type: int, default: 1}\n"
+    )
+    yield path
+    clear_cache()
+
+
+def test_read_model_hits_are_isolated(variables_file):
+    first = read_model(variables_file, root_locator, Variables)
+    first.update({"alpha": "changed"})
+    second = read_model(variables_file, root_locator, Variables)
+
+    assert first.root[0].value == "changed"
+    assert second.root[0].value != "changed"
+    assert second == read_model(variables_file, root_locator, Variables)
+
+
+def test_read_model_concurrent_with_eviction(yaml_files, monkeypatch):
+    monkeypatch.setattr(yaml_reader, "YAML_CACHE_SIZE", 3)
+
+    def read_all(round_index):
+        for offset in range(len(yaml_files) * 4):
+            index = (round_index + offset) % len(yaml_files)
+            model = read_model(yaml_files[index], root_locator, _Record)
+            assert model.id == index
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        for future in [executor.submit(read_all, i) for i in range(16)]:
+            future.result()
+
+    assert len(yaml_reader._model_cache) <= 3
+
+
+def test_read_model_nested_values_are_isolated(tmp_path):
+    clear_cache()
+    path = tmp_path / "meta.yaml"
+    path.write_text("title: Node\ntags: [a]\nattributes: {limits: [1, 2]}\n")
+
+    first = read_model(path, root_locator, Metadata)
+    first.tags.append("b")
+    first.attributes["limits"].append(3)
+    second = read_model(path, root_locator, Metadata)
+
+    assert second.tags == ["a"]
+    assert second.attributes == {"limits": [1, 2]}
+    clear_cache()
+
+
+@pytest.fixture
+def model_cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "model-cache"
+    cache_dir.mkdir(mode=0o700)
+    monkeypatch.setenv(EnvVar.YAML_MODEL_CACHE_DIR.value, str(cache_dir))
+    clear_cache()
+    yield cache_dir
+    clear_cache()
+
+
+def _plant_sidecar(cache_dir, path):
+    """Reads `path` once, then replaces its persisted model with a marked one."""
+    read_model(path, root_locator, _Record)
+    clear_cache()
+    (sidecar,) = cache_dir.glob("*.pkl")
+    sidecar.write_bytes(pickle.dumps(_Record(id=-1, items=["from cache"])))
+    return sidecar
+
+
+def test_read_model_persists_models(tmp_path, model_cache_dir):
+    path = tmp_path / "variables.yaml"
+    path.write_text("- {name: alpha, type: string, default: !var beta}\n")
+
+    first = read_model(path, root_locator, Variables)
+    clear_cache()
+    (sidecar,) = model_cache_dir.glob("*.pkl")
+
+    assert sidecar.stat().st_mode & 0o777 == 0o600
+    assert read_model(path, root_locator, Variables) == first
+
+
+def test_read_model_loads_private_sidecar(yaml_files, model_cache_dir):
+    _plant_sidecar(model_cache_dir, yaml_files[0])
+
+    assert read_model(yaml_files[0], root_locator, _Record).id == -1
+
+
+@pytest.mark.parametrize("mode", [0o620, 0o602])
+def test_read_model_ignores_writable_sidecar(yaml_files, model_cache_dir, mode):
+    sidecar = _plant_sidecar(model_cache_dir, yaml_files[0])
+    sidecar.chmod(mode)
+
+    assert read_model(yaml_files[0], root_locator, _Record).id == 0
+
+
+def test_read_model_ignores_symlinked_sidecar(yaml_files, model_cache_dir, tmp_path):
+    sidecar = _plant_sidecar(model_cache_dir, yaml_files[0])
+    target = tmp_path / "elsewhere.pkl"
+    sidecar.rename(target)
+    sidecar.symlink_to(target)
+
+    assert read_model(yaml_files[0], root_locator, _Record).id == 0
+
+
+@pytest.mark.parametrize("mode", [0o770, 0o777])
+def test_read_model_ignores_shared_cache_dir(yaml_files, model_cache_dir, mode):
+    _plant_sidecar(model_cache_dir, yaml_files[0])
+    model_cache_dir.chmod(mode)
+
+    assert read_model(yaml_files[0], root_locator, _Record).id == 0
+    clear_cache()
+    # Nothing is written to it either
+    read_model(yaml_files[1], root_locator, _Record)
+    assert len(list(model_cache_dir.glob("*.pkl"))) == 1
@@ -42,6 +42,7 @@ tags = ["fs"]
 
 class RetrievalMode(StrEnum):
     FILE_TREE = "file-tree"
+    FILE_TREE_STREAM = "file-tree-stream"
     DOWNLOAD = "download"
 
 
@@ -62,6 +63,7 @@ class Result(BaseModel):
 
 retrieval_handlers = {
     RetrievalMode.FILE_TREE: lambda t, p: t.files.get_directory_tree(p),
+    RetrievalMode.FILE_TREE_STREAM: lambda t, p: t.files.stream_directory_tree(p),
     RetrievalMode.DOWNLOAD: lambda t, p: t.files.download(p),
 }
 
@@ -121,7 +123,8 @@ async def get_template_file_data(
     template_id: str,
     file_path: str,
     mode: RetrievalMode = Query(
-        ..., description="Content type to retrieve: 'file_tree' or 'download'"
+        ...,
+        description="Content type to retrieve: 'file-tree', 'file-tree-stream' or 'download'",
     ),
     templates_repo: TemplatesRepository = Depends(templates_repository),
 ) -> Any:
@@ -11,6 +11,7 @@ from typing import Any, List, Optional
 
 from fastapi import APIRouter, Body, Depends, File, HTTPException, Query, UploadFile
 from pydantic import BaseModel, Field, RootModel
+from starlette.concurrency import run_in_threadpool
 from starlette.status import HTTP_400_BAD_REQUEST
 
 from vcti.wtf.template.metadata import Metadata
@@ -159,13 +160,19 @@ async def get_template_list(
     Raises:
         HTTPException: 500 error if template listing fails due to server issues.
     """
-    templates_list = templates_repo.list_templates()
+    # Listing validates templates and reads their metadata from disk, so it
+    # runs in the thread pool instead of blocking the event loop
+    return await run_in_threadpool(_build_template_catalog, templates_repo)
+
+
+def _build_template_catalog(templates_repo: TemplatesRepository) -> TemplateCatalog:
+    """Lists the valid templates of a repository together with their metadata."""
     return TemplateCatalog(
         root=[
             TemplateManifest(
                 id=template.id, metadata=template.workflow_nodes.metadata()
             )
-            for template in templates_list
+            for template in templates_repo.list_templates()
         ]
     )
 
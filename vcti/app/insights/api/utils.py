@@ -6,9 +6,11 @@
 # This file is the property of Visual Collaboration Technologies Inc.
 # Unauthorized access, reproduction, or redistribution of any kind is prohibited.
 
+import itertools
 import logging
+import os
+import secrets
 import time
-import uuid
 from functools import partial, wraps
 from typing import Any, Awaitable, Callable, Dict, List, Optional
 
@@ -25,6 +27,22 @@ from vcti.wtf.template.repository import TemplatesRepository
 
 logger = logging.getLogger("uvicorn.info")
 
+# Random 32-bit base drawn once per process, combined with a counter so that
+# `create_unique_file_name` needs no entropy read per call
+_UNIQUE_NAME_BASE = secrets.randbits(32)
+_unique_name_counter = itertools.count()
+
+
+def _reseed_unique_names() -> None:
+    """Draws a new base and counter, so that forked workers do not repeat names."""
+    global _UNIQUE_NAME_BASE, _unique_name_counter
+    _UNIQUE_NAME_BASE = secrets.randbits(32)
+    _unique_name_counter = itertools.count()
+
+
+if hasattr(os, "register_at_fork"):  # Not available on Windows
+    os.register_at_fork(after_in_child=_reseed_unique_names)
+
 
 def get_existing_template_or_404(template_id: str, repo: TemplatesRepository):
     """Fetches a template from the repository or raises an HTTP 404 if not found.
@@ -123,11 +141,13 @@ def create_unique_file_name() -> str:
 
     Note:
         - Timestamp ensures temporal ordering
-        - UUID provides collision resistance
+        - A per-process counter makes names unique within the process; the
+          random per-process base, drawn again in forked children, keeps
+          processes apart
         - Fixed length of 19 characters (10 + 1 + 8)
     """
     timestamp = str(int(time.time()))  # 10-digit timestamp
-    random_str = uuid.uuid4().hex[:8]  # 8-character random string
+    random_str = f"{_UNIQUE_NAME_BASE ^ (next(_unique_name_counter) & 0xFFFFFFFF):08x}"
     return f"{timestamp}_{random_str}"
 
 
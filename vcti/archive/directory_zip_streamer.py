@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+
+# Copyright (C) 2018 Visual Collaboration Technologies Inc.
+# All Rights Reserved.
+#
+# This file is a property of Visual Collaboration Technologies Inc.
+# Unauthorized access, reproduction or redistribution of any kind is prohibited.
+"""
+A streaming ZIP generator for directory contents with constant memory usage.
+"""
+
+import os
+import time
+import zipfile
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+# Read size for file contents. Large reads let zlib use its vectorized CRC32
+# and deflate paths.
+READ_BUFFER_SIZE = 1 << 20
+
+# Files with these suffixes are already compressed and are stored as-is
+COMPRESSED_SUFFIXES = frozenset(
+    {".zip", ".png", ".jpg", ".jpeg", ".mp4", ".gz", ".xz", ".zst"}
+)
+
+# ZipInfo only has a public per-entry compression level from Python 3.13
+_ZIPINFO_HAS_COMPRESS_LEVEL = hasattr(zipfile.ZipInfo, "compress_level")
+
+# Earliest and latest timestamps that can be stored in a ZIP entry
+_MIN_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+_MAX_DATE_TIME = (2107, 12, 31, 23, 59, 59)
+
+
+class _ChunkSink:
+    """
+    Write-only file object that collects ZipFile output until it is drained.
+
+    It has no `seek`/`tell`, so ZipFile writes entries with data descriptors
+    and never goes back to patch local headers.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+        self.size = 0
+
+    def write(self, data) -> int:
+        # Stored entries pass views of the shared read buffer; copy them
+        self._chunks.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        """Returns and clears all data written so far."""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        self.size = 0
+        return data
+
+
+class DirectoryZipStreamer:
+    """
+    Streams a ZIP archive of a directory as it is being compressed.
+
+    Archive data is handed out as soon as at least `chunk_size` bytes have
+    been produced and is never kept after it is yielded, so memory usage is independent of the directory size and the
+    first bytes are sent after compressing the first file.
+
+    Files are deflated at level 1, except for already-compressed formats
+    (see `COMPRESSED_SUFFIXES`) which are stored. Before Python 3.13 the level
+    of an entry cannot be set through the public `ZipInfo` API, so zlib's
+    default level is used there.
+
+    Typical Usage:
+        >>> streamer = DirectoryZipStreamer(Path("/path/to/directory"))
+        >>> StreamingResponse(streamer, media_type="application/zip")
+
+    Note:
+        This is a synchronous iterator; Starlette's StreamingResponse iterates it
+        in its thread pool, so compression does not block the event loop.
+    """
+
+    def __init__(
+        self,
+        directory_path: Path,
+        chunk_size: int = 65536,
+        compresslevel: int = 1,
+    ) -> None:
+        """
+        Initialize the ZIP streamer for a directory.
+
+        Args:
+            directory_path: Path to the directory to be zipped
+            chunk_size: Minimum size of data chunks to yield (in bytes)
+            compresslevel: Deflate level used for compressible files
+
+        Raises:
+            ValueError: If directory_path doesn't exist or isn't a directory
+        """
+        if not directory_path.is_dir():
+            raise ValueError(f"Path is not a directory: {directory_path}")
+
+        self.directory_path = directory_path.resolve()
+        self.chunk_size = chunk_size
+        self.compresslevel = compresslevel
+
+    def _collect_files(self) -> List[Tuple[str, str, os.stat_result]]:
+        """
+        Lists all files in the directory tree using `os.scandir`.
+
+        Returns:
+            List of (absolute path, archive name, stat result) tuples.
+
+        Raises:
+            RuntimeError: If directory traversal fails
+        """
+        files = []
+        pending = [(str(self.directory_path), "")]
+        try:
+            while pending:
+                dir_path, prefix = pending.pop()
+                with os.scandir(dir_path) as it:
+                    for entry in it:
+                        arcname = prefix + entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append((entry.path, arcname + "/"))
+                        elif entry.is_file():
+                            files.append((entry.path, arcname, entry.stat()))
+        except OSError as e:
+            raise RuntimeError(f"Directory traversal failed: {str(e)}") from e
+        return files
+
+    def _zip_info(self, arcname: str, st: os.stat_result) -> zipfile.ZipInfo:
+        """
+        Creates the archive entry header for a file.
+
+        Equivalent to `ZipInfo.from_file`, but uses the stat result cached
+        during directory traversal instead of calling `stat` again.
+        Timestamps outside the range supported by ZIP are clamped.
+        """
+        date_time = time.localtime(st.st_mtime)[:6]
+        date_time = min(max(date_time, _MIN_DATE_TIME), _MAX_DATE_TIME)
+
+        zinfo = zipfile.ZipInfo(arcname, date_time)
+        zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+        zinfo.file_size = st.st_size
+        if os.path.splitext(arcname)[1].lower() in COMPRESSED_SUFFIXES:
+            zinfo.compress_type = zipfile.ZIP_STORED
+        else:
+            zinfo.compress_type = zipfile.ZIP_DEFLATED
+            if _ZIPINFO_HAS_COMPRESS_LEVEL:
+                zinfo.compress_level = self.compresslevel
+        return zinfo
+
+    def __iter__(self) -> Iterator[bytes]:
+        """
+        Main generator interface that yields ZIP data chunks.
+
+        Yields:
+            bytes: Chunks of ZIP file data
+
+        Raises:
+            RuntimeError: If ZIP creation fails at any point
+        """
+        sink = _ChunkSink()
+        read_view = memoryview(bytearray(READ_BUFFER_SIZE))
+
+        try:
+            with zipfile.ZipFile(
+                sink, "w", zipfile.ZIP_DEFLATED, compresslevel=self.compresslevel
+            ) as zip_file:
+                for file_path, arcname, st in self._collect_files():
+                    zinfo = self._zip_info(arcname, st)
+                    with open(file_path, "rb") as src, zip_file.open(zinfo, "w") as dst:
+                        while size := src.readinto(read_view):
+                            dst.write(read_view[:size])
+                            if sink.size >= self.chunk_size:
+                                yield sink.drain()
+
+            # Remaining entry data and the central directory
+            if remaining := sink.drain():
+                yield remaining
+
+        except (OSError, zipfile.LargeZipFile) as e:
+            raise RuntimeError(f"ZIP streaming failed: {str(e)}") from e
@@ -23,5 +23,8 @@ class ArchiveExtractor:
     def extract_using_tempfile(self):
         raise NotImplementedError("Subclasses must implement extract_using_tempfile")
 
+    def extract_streaming(self):
+        raise NotImplementedError("Subclasses must implement extract_streaming")
+
 class UnsupportedArchiveFormat(Exception):
     pass
\ No newline at end of file
@@ -12,12 +12,17 @@ TemplateFileManager class provides methods to manage files in a template directo
 import zipfile
 from pathlib import Path
 from io import BytesIO
-from tempfile import NamedTemporaryFile
+from tempfile import NamedTemporaryFile, SpooledTemporaryFile
+from typing import BinaryIO, Optional
 from fastapi import UploadFile
 import shutil
 
 from .extrctor_base import ArchiveExtractor, UnsupportedArchiveFormat
 
+# Buffer size used when copying archive data
+COPY_BUFFER_SIZE = 1 << 20
+
+
 class ZipExtractor(ArchiveExtractor):
     def __init__(self, archive: UploadFile, target_dir_path: Path):
         super().__init__(archive, target_dir_path)
@@ -44,3 +49,74 @@ class ZipExtractor(ArchiveExtractor):
             tmp.seek(0)
             with zipfile.ZipFile(tmp.name) as zip_ref:
                 zip_ref.extractall(self.target_dir)
+
+    def extract_streaming(self, spool_threshold_mb: int = 64):
+        """
+        Extracts the archive entry by entry without loading it into memory.
+
+        A seekable upload (Starlette spools uploads to a temporary file) is
+        read in place. Otherwise it is first copied into a SpooledTemporaryFile
+        which moves to disk once it grows past `spool_threshold_mb`.
+
+        Args:
+            spool_threshold_mb (int): In-memory limit of the spool, in MiB.
+        """
+        source = self.archive.file
+        if source.seekable():
+            source.seek(0)
+            self._extract_entries(source)
+            return
+
+        with SpooledTemporaryFile(max_size=spool_threshold_mb << 20) as spool:
+            shutil.copyfileobj(source, spool, COPY_BUFFER_SIZE)
+            spool.seek(0)
+            self._extract_entries(spool)
+
+    def _extract_entries(self, fileobj: BinaryIO):
+        """
+        Writes every entry of the ZIP archive in `fileobj` below the target directory.
+        """
+        created_dirs = set()
+        # One buffer for all entries instead of a new bytes object per read
+        buffer = memoryview(bytearray(COPY_BUFFER_SIZE))
+        with zipfile.ZipFile(fileobj) as zip_ref:
+            for info in zip_ref.infolist():
+                dest = self._member_path(info.filename)
+                if dest is None:
+                    continue
+                if info.is_dir():
+                    if dest not in created_dirs:
+                        dest.mkdir(parents=True, exist_ok=True)
+                        created_dirs.add(dest)
+                    continue
+                if dest.parent not in created_dirs:
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(dest.parent)
+                with zip_ref.open(info) as src, open(dest, "wb") as dst:
+                    while size := src.readinto(buffer):
+                        dst.write(buffer[:size])
+
+    def _member_path(self, filename: str) -> Optional[Path]:
+        """
+        Maps an archive member name to a path inside the target directory.
+
+        Like `ZipFile.extractall`, absolute paths, drive letters and `..`
+        components are dropped so that entries cannot escape the target
+        directory on any platform.
+
+        Returns:
+            Optional[Path]: Destination path, or None if nothing remains of the name.
+        """
+        parts = [
+            part
+            for part in filename.replace("\\", "/").split("/")
+            if part not in ("", ".", "..")
+        ]
+        if parts and len(parts[0]) >= 2 and parts[0][1] == ":":
+            # "C:x" is drive-relative on Windows
+            parts[0] = parts[0][2:]
+            if not parts[0]:
+                del parts[0]
+        if not parts:
+            return None
+        return self.target_dir.joinpath(*parts)
@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+
+# Copyright (C) 2018 Visual Collaboration Technologies Inc.
+# All Rights Reserved.
+#
+# This file is a property of Visual Collaboration Technologies Inc.
+# Unauthorized access, reproduction or redistribution of any kind is prohibited.
+"""Helpers for copying files and directory trees within the same filesystem."""
+
+import io
+import os
+import shutil
+import stat
+from pathlib import Path
+from tempfile import SpooledTemporaryFile
+from typing import BinaryIO, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+# Buffer size for the user-space copy fallback
+COPY_BUFSIZE = 1 << 20
+
+# Linux ioctl that makes a file share the data blocks of another (reflink)
+FICLONE = 0x40049409
+
+
+def copy_path(source: Union[str, Path], target: Union[str, Path]) -> None:
+    """
+    Copies a file or a directory tree to a new location.
+
+    The source type is determined with a single `lstat` call. Files are copied
+    with `clone_file` and directories with `reflink_tree`, so on filesystems
+    with copy-on-write support (btrfs, XFS) no file data is copied at all.
+
+    Note:
+        Copies are never hard links. Template files are rewritten in place
+        (e.g. on upload with replace or run status updates), so sharing inodes
+        between a template and its duplicate would modify both. Reflinked
+        files are separate inodes whose blocks are unshared on write.
+
+    Args:
+        source (Union[str, Path]): Existing file or directory to copy.
+        target (Union[str, Path]): Destination path. Must not exist.
+
+    Raises:
+        FileNotFoundError: If the source does not exist.
+        FileExistsError: If the target already exists.
+        RuntimeError: If the source is neither a regular file nor a directory.
+    """
+    mode = os.lstat(source).st_mode
+
+    if stat.S_ISREG(mode):
+        clone_file(source, target)
+    elif stat.S_ISDIR(mode):
+        reflink_tree(source, target)
+    else:
+        raise RuntimeError(f"Cannot copy path: {source}")
+
+
+def clone_file(source: Union[str, Path], target: Union[str, Path]) -> None:
+    """
+    Copies a file along with its permission bits and timestamps.
+
+    The copy is made with the `FICLONE` ioctl where the filesystem supports
+    it, so both files share their data blocks until either one is modified.
+    Otherwise the data is copied in the kernel (`copy_file_range`/`sendfile`)
+    or, as a last resort, through a user-space buffer.
+
+    Args:
+        source (Union[str, Path]): Existing file to copy.
+        target (Union[str, Path]): Destination path. Must not exist.
+
+    Raises:
+        FileExistsError: If the target already exists.
+    """
+    with open(source, "rb") as src:
+        src_fd = src.fileno()
+        dst_fd = os.open(
+            target,
+            os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_CLOEXEC", 0),
+            0o666,
+        )
+        with open(dst_fd, "wb", closefd=True) as dst:
+            if fcntl is not None:
+                try:
+                    fcntl.ioctl(dst_fd, FICLONE, src_fd)
+                    src_fd = None
+                except OSError:
+                    # Not supported by the filesystem or across filesystems;
+                    # the target is still empty, so copy the data instead
+                    pass
+
+            if src_fd is not None:
+                size = os.fstat(src_fd).st_size
+                copied = _copy_fd_range(src_fd, dst_fd, size)
+                if copied < size:
+                    # Finish in user space from where the kernel copy stopped
+                    src.seek(copied)
+                    dst.seek(copied)
+                    shutil.copyfileobj(src, dst, COPY_BUFSIZE)
+
+    shutil.copystat(source, target)
+
+
+def reflink_tree(
+    source: Union[str, Path], target: Union[str, Path], dirs_exist_ok: bool = False
+) -> None:
+    """
+    Recursively copies a directory tree, cloning each file with `clone_file`.
+
+    Directories are listed with `os.scandir`, so entry types come from the
+    directory listing. Like `shutil.copytree`, symbolic links are followed and
+    the contents they point to are copied.
+
+    Args:
+        source (Union[str, Path]): Existing directory to copy.
+        target (Union[str, Path]): Destination directory.
+        dirs_exist_ok (bool): If True, existing directories in the target are
+            reused, as with `shutil.copytree`. Otherwise the target must not exist.
+
+    Raises:
+        FileExistsError: If the target already exists and dirs_exist_ok is False.
+    """
+    try:
+        os.mkdir(target)
+    except FileExistsError:
+        if not dirs_exist_ok:
+            raise
+    with os.scandir(source) as it:
+        entries = list(it)
+
+    for entry in entries:
+        child_target = os.path.join(target, entry.name)
+        if entry.is_dir():
+            reflink_tree(entry.path, child_target, dirs_exist_ok)
+        else:
+            clone_file(entry.path, child_target)
+
+    shutil.copystat(source, target)
+
+
+def _backing_fileno(fileobj: BinaryIO) -> Optional[int]:
+    """
+    Returns the OS file descriptor backing a stream, or None if it has none.
+
+    A `SpooledTemporaryFile` only has a real descriptor once it has rolled over
+    to disk; calling its `fileno()` earlier would force that rollover. If its
+    rollover state cannot be told, it is treated as still in memory.
+    """
+    if isinstance(fileobj, SpooledTemporaryFile) and not getattr(
+        fileobj, "_rolled", False
+    ):
+        return None
+    try:
+        return fileobj.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+
+def _copy_fd_range(src_fd: int, dst_fd: int, size: int) -> int:
+    """
+    Copies `size` bytes between file descriptors inside the kernel.
+
+    Uses `os.copy_file_range`, which lets the filesystem share extents or copy
+    server-side, and falls back to `os.sendfile` if it is not supported for
+    these files.
+
+    Returns:
+        int: Number of bytes copied. Zero means that neither system call is
+        usable. Less than `size` means that the copy stopped early (the source
+        shrank, or the file system reported end of file); the caller must copy
+        the rest itself, starting at the returned offset.
+    """
+    offset = 0
+    for kernel_copy in (getattr(os, "copy_file_range", None), getattr(os, "sendfile", None)):
+        if kernel_copy is None:
+            continue
+        try:
+            while offset < size:
+                count = min(size - offset, COPY_BUFSIZE)
+                if kernel_copy is os.sendfile:
+                    copied = kernel_copy(dst_fd, src_fd, offset, count)
+                else:
+                    copied = kernel_copy(src_fd, dst_fd, count, offset, offset)
+                if copied == 0:
+                    break
+                offset += copied
+            return offset
+        except OSError:
+            # Unsupported for this pair of files (e.g. cross-device on older
+            # kernels); only safe to try the next method if nothing was copied
+            if offset:
+                raise
+    return 0
+
+
+def copy_stream_to_file(fileobj: BinaryIO, target: Union[str, Path]) -> None:
+    """
+    Writes the entire contents of a seekable binary stream to a file.
+
+    The stream is rewound before copying. When it is backed by a real file
+    (e.g. an upload spooled to disk), the data is copied in the kernel with
+    `os.copy_file_range` or `os.sendfile`; otherwise it is copied through a
+    1 MiB user-space buffer.
+
+    Args:
+        fileobj (BinaryIO): Seekable source stream.
+        target (Union[str, Path]): Destination file path. Created or truncated.
+    """
+    fileobj.seek(0, os.SEEK_END)
+    size = fileobj.tell()
+    fileobj.seek(0)
+
+    src_fd = _backing_fileno(fileobj)
+    dst_fd = os.open(
+        target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0), 0o666
+    )
+    with open(dst_fd, "wb", closefd=True) as dst:
+        copied = _copy_fd_range(src_fd, dst_fd, size) if src_fd is not None else 0
+        if copied == size:
+            return
+
+        # Finish in user space from where the kernel copy stopped, if it ran
+        fileobj.seek(copied)
+        dst.seek(copied)
+        shutil.copyfileobj(fileobj, dst, COPY_BUFSIZE)
@@ -7,6 +7,9 @@
 # Unauthorized access, reproduction or redistribution of any kind is prohibited.
 """Utilities for validating and resolving file identifiers relative to a base directory."""
 
+import os
+import re
+import stat
 from pathlib import Path
 from typing import Optional
 
@@ -32,6 +35,14 @@ class FileId:
     - Extracting file IDs from full paths
     """
 
+    # Matches an empty, whitespace-only, "." or ".." component, or a character
+    # that is not allowed in file names (see FileNameValidator), so that a file
+    # ID is checked in a single pass instead of per component.
+    INVALID_PATTERN = re.compile(
+        r"(?:^|/)(?:\.\.?|\s*)(?=/|\Z)"
+        rf"|[{re.escape(FileNameValidator.INVALID_CHARS.replace('/', ''))}]"
+    )
+
     @staticmethod
     def is_valid(file_id: str) -> bool:
         """
@@ -43,20 +54,13 @@ class FileId:
         Returns:
             bool: True if valid, False otherwise.
         """
-        if not file_id or file_id.strip() == "":
-            return False
-
-        if file_id.startswith(("/", "./", "../")):
+        if not file_id:
             return False
 
         if file_id.endswith("/") and len(file_id) > 1:
             file_id = file_id.rstrip("/")
 
-        try:
-            parts = file_id.split("/")
-            return all(FileNameValidator.is_valid(part) for part in parts)
-        except Exception:
-            return False
+        return FileId.INVALID_PATTERN.search(file_id) is None
 
     @staticmethod
     def validate(file_id: str) -> None:
@@ -98,25 +102,54 @@ class FileId:
             ValueError: If file ID is invalid.
             FileNotFoundError, NotADirectoryError, IsADirectoryError: Based on flags.
         """
-        target = base_dir.joinpath(Path(file_id)) if file_id else base_dir
-
         # Validate file ID if provided
         if file_id:
             FileId.validate(file_id)
 
-        if must_exist and not target.exists():
-            raise FileNotFoundError(f"Path does not exist: {target}")
+        # Join as strings so that only the final Path object is constructed
+        target = Path(os.path.join(base_dir, file_id)) if file_id else base_dir
 
-        if target.exists():
-            if target.is_symlink():
-                raise RuntimeError(f"Symbolic links are not supported: {target}")
-            if must_be_dir and not target.is_dir():
-                raise NotADirectoryError(f"Expected a directory: {target}")
-            if must_be_file and not target.is_file():
-                raise IsADirectoryError(f"Expected a file: {target}")
+        # A single lstat answers all checks below
+        try:
+            mode = os.lstat(target).st_mode
+        except (FileNotFoundError, NotADirectoryError):
+            if must_exist:
+                raise FileNotFoundError(f"Path does not exist: {target}")
+            return target
+
+        if stat.S_ISLNK(mode):
+            raise RuntimeError(f"Symbolic links are not supported: {target}")
+        if must_be_dir and not stat.S_ISDIR(mode):
+            raise NotADirectoryError(f"Expected a directory: {target}")
+        if must_be_file and not stat.S_ISREG(mode):
+            raise IsADirectoryError(f"Expected a file: {target}")
 
         return target
 
+    @staticmethod
+    def compose(parent_file_id: Optional[str], name: str, is_dir: bool = False) -> str:
+        """
+        Build the file ID of an entry inside a directory, without filesystem access.
+
+        Args:
+            parent_file_id (Optional[str]): File ID of the containing directory,
+                with or without a trailing "/". Empty or None for the base directory.
+            name (str): Name of the entry.
+            is_dir (bool): Whether the entry is a directory, in which case the
+                file ID ends with "/" (as returned by `get_file_id`).
+
+        Returns:
+            str: File ID in POSIX format.
+
+        Raises:
+            ValueError: If the name is not a valid file or directory name.
+        """
+        FileNameValidator.validate(name)
+
+        parent = parent_file_id.rstrip("/") if parent_file_id else ""
+        file_id = f"{parent}/{name}" if parent else name
+        return file_id + "/" if is_dir else file_id
+
     @staticmethod
     def get_file_id(file_path: Path, base_dir: Path) -> str:
         """
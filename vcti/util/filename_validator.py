@@ -33,6 +33,12 @@ class FileNameValidator:
     INVALID_PATTERN = re.compile(rf"[{re.escape(INVALID_CHARS)}]")
     RESERVED_NAMES = {".", ".."}
 
+    # All rules as one pattern, so that a name is checked in a single match
+    VALID_PATTERN = re.compile(
+        r"(?!\s*\Z)(?!\.\.?\Z)"
+        rf"[^{re.escape(INVALID_CHARS)}]+\Z"
+    )
+
     @classmethod
     def is_valid(cls, name: str) -> bool:
         """
@@ -44,16 +50,7 @@ class FileNameValidator:
         Returns:
             bool: True if valid, False otherwise.
         """
-        if not name or name.strip() == "":
-            return False
-
-        if name in cls.RESERVED_NAMES:
-            return False
-
-        if cls.INVALID_PATTERN.search(name):
-            return False
-
-        return True
+        return cls.VALID_PATTERN.match(name) is not None
 
     @classmethod
     def validate(cls, name: str) -> None:
@@ -8,7 +8,7 @@
 
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 from git import Repo
 import git.exc
 import shutil
@@ -62,29 +62,51 @@ class GitRepositoryManager:
     def create_from_remote(
         self,
         remote_url: str,
-        overwrite: bool = False
+        overwrite: bool = False,
+        depth: Optional[int] = None,
+        filter_spec: Optional[str] = None,
+        sparse_paths: Optional[List[str]] = None
     ) -> Path:
         """
         Clone a remote repository to the local path.
-        
+
+        By default the full repository is cloned. For templates kept in a
+        subtree of a large repository, `depth`, `filter_spec` and
+        `sparse_paths` limit the clone to recent history, fetch objects on
+        demand, and check out only the given directories.
+
         Args:
             remote_url: URL of the remote repository
             overwrite: If True, overwrite existing directory
-            
+            depth: If given, clone only this many commits of history
+            filter_spec: Partial clone filter, e.g. "tree:0" or "blob:none"
+            sparse_paths: If given, check out only these directories (cone mode)
+
         Returns:
             Path to the cloned repository
-            
+
         Raises:
             ValueError: If local path exists and overwrite=False
-            git.exc.GitCommandError: If clone fails
+            RuntimeError: If clone fails
         """
         if self._local_repo_path.exists():
             if not overwrite:
                 raise ValueError(f"Path already exists: {self._local_repo_path}")
             shutil.rmtree(self._local_repo_path)
 
+        clone_options: Dict[str, Any] = {}
+        if depth is not None:
+            clone_options["depth"] = depth
+        if filter_spec is not None:
+            clone_options["filter"] = filter_spec
+        if sparse_paths:
+            clone_options["no_checkout"] = True
+
         try:
-            Repo.clone_from(remote_url, self._local_repo_path)
+            repo = Repo.clone_from(remote_url, self._local_repo_path, **clone_options)
+            if sparse_paths:
+                repo.git.sparse_checkout("set", "--cone", *sparse_paths)
+                repo.git.checkout()
             return self._local_repo_path
         except git.exc.GitCommandError as e:
             if self._local_repo_path.exists():
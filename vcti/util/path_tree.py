@@ -6,8 +6,10 @@
 # This file is a property of Visual Collaboration Technologies Inc.
 # Unauthorized access, reproduction or redistribution of any kind is prohibited.
 
+import os
+from array import array
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Union
 from pydantic import BaseModel
 
 from .value_generated_enums import EnumValueLowerCase, auto_enum_value
@@ -36,12 +38,12 @@ class Directory(PathBase):
 Directory.model_rebuild()
 
 
-def handle_file(
+def path_value(
     path_obj: Path,
     base_path: Optional[Path] = None,
     as_posix: bool = False
-) -> File:
-    """Create a File model from a Path object."""
+) -> str:
+    """Return the path string stored in a tree node."""
     path_val = (
         path_obj.relative_to(base_path)
         if base_path
@@ -49,9 +51,18 @@ def handle_file(
     )
     if as_posix:
         path_val = path_val.as_posix()
+    return str(path_val)
+
+
+def handle_file(
+    path_obj: Path,
+    base_path: Optional[Path] = None,
+    as_posix: bool = False
+) -> File:
+    """Create a File model from a Path object."""
     return File(
         name=path_obj.name,
-        path=str(path_val),
+        path=path_value(path_obj, base_path, as_posix),
         size=path_obj.stat().st_size
     )
 
@@ -61,24 +72,26 @@ def handle_directory(
     as_posix: bool = False
 ) -> Directory:
     """Create a Directory model, recursively including children."""
-    path_val = (
-        path_obj.relative_to(base_path)
-        if base_path
-        else path_obj
-    )
-    if as_posix:
-        path_val = path_val.as_posix()
-
     dir_item = Directory(
         name=path_obj.name,
-        path=str(path_val),
+        path=path_value(path_obj, base_path, as_posix),
         children=[]
     )
-    for child in sorted(path_obj.iterdir()):
-        if child.is_file():
-            dir_item.children.append(handle_file(child, base_path, as_posix))
+    # DirEntry reuses the file type returned by the directory listing, so
+    # only files need a stat call (for their size)
+    with os.scandir(path_obj) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+
+    for entry in entries:
+        child_path = Path(entry.path)
+        if entry.is_file():
+            dir_item.children.append(File(
+                name=entry.name,
+                path=path_value(child_path, base_path, as_posix),
+                size=entry.stat().st_size
+            ))
         else:
-            dir_item.children.append(handle_directory(child, base_path, as_posix))
+            dir_item.children.append(handle_directory(child_path, base_path, as_posix))
     return dir_item
 
 
@@ -116,6 +129,186 @@ def get_path_tree(
     return dir_item.children if skip_root else [dir_item]
 
 
+PathTreeData = List[Dict[str, Any]]
+
+
+class PathTreeArrays(NamedTuple):
+    """
+    Structure-of-arrays form of a directory tree.
+
+    Entry `i` is named `names[i]` and is contained in entry `parents[i]`
+    (-1 for the root, which is entry 0). It is a directory if `is_dir[i]` is
+    non-zero, otherwise a file of `sizes[i]` bytes. Every directory precedes
+    its entries, which are contiguous and sorted by name.
+    """
+    names: List[str]
+    parents: array
+    is_dir: bytearray
+    sizes: array
+
+
+def scan_path_tree(path: Path) -> PathTreeArrays:
+    """
+    Scans a directory tree into flat arrays with `os.scandir`.
+
+    Args:
+        path: Directory to scan.
+
+    Returns:
+        PathTreeArrays describing the directory and everything below it.
+    """
+    names = [path.name]
+    parents = array("i", [-1])
+    is_dir = bytearray(b"\x01")
+    sizes = array("q", [0])
+
+    pending = [(0, str(path))]
+    while pending:
+        index, dir_path = pending.pop()
+        with os.scandir(dir_path) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+
+        for entry in entries:
+            names.append(entry.name)
+            parents.append(index)
+            if entry.is_file():
+                is_dir.append(0)
+                sizes.append(entry.stat().st_size)
+            else:
+                is_dir.append(1)
+                sizes.append(0)
+                pending.append((len(names) - 1, entry.path))
+
+    return PathTreeArrays(names, parents, is_dir, sizes)
+
+
+def get_path_tree_data(
+    path: Path,
+    base_path: Optional[Path] = None,
+    as_posix: bool = False,
+    skip_root: bool = False
+) -> PathTreeData:
+    """
+    Returns folder structure as JSON-ready dictionaries.
+
+    Produces the same structure as `get_path_tree(...)` dumped to JSON, but
+    scans into `PathTreeArrays` and builds plain dictionaries from them, so
+    no Pydantic model is validated per entry. Child paths are built by
+    joining names onto the parent path instead of computing one relative
+    path per entry.
+
+    Args:
+        path: File or directory path to scan.
+        base_path: If provided, paths are stored relative to this directory.
+        as_posix: If True, forces forward slashes in paths.
+        skip_root: If True, returns only children (empty list for files).
+
+    Returns:
+        List of directory/file dictionaries
+    """
+    if not path.exists():
+        return []
+
+    if path.is_file():
+        file_item = handle_file(path, base_path, as_posix).model_dump(mode="json")
+        return [] if skip_root else [file_item]
+
+    tree = scan_path_tree(path)
+    separator = "/" if as_posix else os.sep
+    file_type = PathType.FILE.value
+    directory_type = PathType.DIRECTORY.value
+
+    root_path = path_value(path, base_path, as_posix)
+    nodes = [{
+        "name": path.name,
+        "path": root_path,
+        "type": directory_type,
+        "children": [],
+    }]
+    # Directory index -> path prefix of its entries
+    prefixes = {0: "" if root_path == "." else root_path + separator}
+
+    for index in range(1, len(tree.names)):
+        parent = tree.parents[index]
+        name = tree.names[index]
+        entry_path = prefixes[parent] + name
+        if tree.is_dir[index]:
+            node = {
+                "name": name,
+                "path": entry_path,
+                "type": directory_type,
+                "children": [],
+            }
+            prefixes[index] = entry_path + separator
+        else:
+            node = {
+                "name": name,
+                "path": entry_path,
+                "type": file_type,
+                "size": tree.sizes[index],
+            }
+        nodes.append(node)
+        nodes[parent]["children"].append(node)
+
+    return nodes[0]["children"] if skip_root else [nodes[0]]
+
+
+def iter_path_tree(
+    path: Path,
+    base_path: Optional[Path] = None,
+    as_posix: bool = False
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yields the folder structure one directory at a time, top-down.
+
+    Each record describes a directory and its immediate children, using the
+    same fields as the `Directory`/`File` models. Child directories are listed
+    without children and are followed by their own records, so a client can
+    rebuild the tree from the `path` fields while the server never holds more
+    than one directory listing in memory.
+
+    Args:
+        path: Directory to scan. Nothing is yielded if it is not a directory.
+        base_path: If provided, paths are stored relative to this directory.
+        as_posix: If True, forces forward slashes in paths.
+
+    Yields:
+        Dict describing one directory and its immediate children.
+    """
+    if not path.is_dir():
+        return
+
+    pending = [path]
+    while pending:
+        dir_path = pending.pop()
+        with os.scandir(dir_path) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+
+        children = []
+        sub_dirs = []
+        for entry in entries:
+            child_path = Path(entry.path)
+            child = {
+                "name": entry.name,
+                "path": path_value(child_path, base_path, as_posix),
+            }
+            if entry.is_file():
+                child["type"] = PathType.FILE
+                child["size"] = entry.stat().st_size
+            else:
+                child["type"] = PathType.DIRECTORY
+                sub_dirs.append(child_path)
+            children.append(child)
+
+        yield {
+            "name": dir_path.name,
+            "path": path_value(dir_path, base_path, as_posix),
+            "type": PathType.DIRECTORY,
+            "children": children,
+        }
+        pending.extend(reversed(sub_dirs))
+
+
 def _cli_tree_lines(node, prefix=""):
     lines = []
     connector = "├── "
@@ -7,12 +7,27 @@
 # Unauthorized access, reproduction or redistribution of any kind is prohibited.
 """Utility functions for handling file and folder paths."""
 
-import re
+import os
+import threading
+import time
 from pathlib import Path
-from typing import Union
+from typing import Dict, Union
 
 from vcti.error import system_error
 
+from .filename_validator import FileNameValidator  # noqa: F401 (re-export)
+
+# Seconds for which a successful `validate_folder_access_cached` check is reused
+FOLDER_ACCESS_TTL = 5.0
+
+# Most folders whose successful check is remembered at once
+FOLDER_ACCESS_CACHE_SIZE = 1024
+
+# Monotonic time of the last successful cached folder check, keyed by path,
+# oldest check first
+_validated_folders: Dict[str, float] = {}
+_validated_folders_lock = threading.Lock()
+
 
 def abs_path(fp: Union[Path, str]) -> Path:
     """
@@ -74,6 +89,58 @@ def validate_folder_access(fp: Union[Path, str]) -> None:
         raise system_error(NotADirectoryError, path)
 
 
+def validate_folder_access_cached(
+    fp: Union[Path, str], ttl: float = FOLDER_ACCESS_TTL
+) -> None:
+    """
+    Same as `validate_folder_access`, but skips the filesystem check if the
+    folder was successfully validated within the last `ttl` seconds.
+
+    Intended for folders that are validated on every request (e.g. template
+    roots). Callers that remove or rename such a folder should call
+    `invalidate_folder_access`.
+
+    Args:
+        fp (Union[Path, str]): The folder path to validate.
+        ttl (float): Maximum age, in seconds, of a reusable check.
+
+    Raises:
+        FileNotFoundError: If the directory does not exist.
+        NotADirectoryError: If the path is not a directory.
+    """
+    key = os.fspath(fp)
+    now = time.monotonic()
+    checked_at = _validated_folders.get(key)
+    if checked_at is not None and now - checked_at < ttl:
+        return
+
+    validate_folder_access(fp)
+    with _validated_folders_lock:
+        # Re-inserting keeps the dict ordered by check time, so expired and
+        # excess entries are all at the front
+        _validated_folders.pop(key, None)
+        _validated_folders[key] = now
+        while len(_validated_folders) > 1:
+            oldest = next(iter(_validated_folders))
+            if (
+                now - _validated_folders[oldest] < ttl
+                and len(_validated_folders) <= FOLDER_ACCESS_CACHE_SIZE
+            ):
+                break
+            del _validated_folders[oldest]
+
+
+def invalidate_folder_access(fp: Union[Path, str]) -> None:
+    """
+    Forgets a cached `validate_folder_access_cached` result.
+
+    Args:
+        fp (Union[Path, str]): The folder path that was removed or renamed.
+    """
+    with _validated_folders_lock:
+        _validated_folders.pop(os.fspath(fp), None)
+
+
 def resolve_path(path: Union[Path, str], base_dir: Union[Path, str]) -> Path:
     """
     Resolves a path relative to a base directory, handling both absolute and relative paths.
@@ -98,63 +165,3 @@ def resolve_path(path: Union[Path, str], base_dir: Union[Path, str]) -> Path:
         path = base_dir / path
 
     return path.resolve()
-
-
-class FileNameValidator:
-    """
-    Validates basic file or folder names based on common restrictions.
-
-    Rules:
-    - Must not be "." or ".."
-    - Must not be empty or whitespace only
-    - Must not contain illegal characters: / \\ : * ? " < > |
-
-    This class is useful for validating user-supplied names for files or
-    directories before creating them on the filesystem.
-
-    Example:
-        >>> FileNameValidator.is_valid("file.txt")        # Returns True
-        >>> FileNameValidator.is_valid("invalid|file")    # Returns False
-        >>> FileNameValidator.validate("data.json")       # OK
-        >>> FileNameValidator.validate("bad/name")        # Raises ValueError
-    """
-
-    INVALID_CHARS = r'<>:"/\\|?*'
-    INVALID_PATTERN = re.compile(rf"[{re.escape(INVALID_CHARS)}]")
-    RESERVED_NAMES = {".", ".."}
-
-    @classmethod
-    def is_valid(cls, name: str) -> bool:
-        """
-        Returns whether the given file or folder name is valid.
-
-        Args:
-            name (str): Name to check.
-
-        Returns:
-            bool: True if valid, False otherwise.
-        """
-        if not name or name.strip() == "":
-            return False
-
-        if name in cls.RESERVED_NAMES:
-            return False
-
-        if cls.INVALID_PATTERN.search(name):
-            return False
-
-        return True
-
-    @classmethod
-    def validate(cls, name: str) -> None:
-        """
-        Validates the given file or folder name.
-
-        Args:
-            name (str): The filename to validate.
-
-        Raises:
-            ValueError: If the name is reserved, empty, or contains illegal characters.
-        """
-        if not cls.is_valid(name):
-            raise ValueError(f"Invalid file or directory name: {name!r}")
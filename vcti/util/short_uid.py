@@ -10,6 +10,7 @@
 import base64
 import hashlib
 import random
+import secrets
 import time
 from typing import Optional
 
@@ -48,5 +49,11 @@ class ShortUID:
 
     @classmethod
     def quick(cls, length: int = 8) -> str:
-        """Convenience method to quickly generate a short ID."""
-        return cls(length=length).generate()
+        """
+        Convenience method to quickly generate a short ID.
+
+        Without entropy or salt to mix in, the ID is drawn directly from
+        `secrets` instead of hashing a timestamp, using the same URL-safe
+        alphabet as `generate`.
+        """
+        return secrets.token_urlsafe((length * 3 + 3) // 4)[:length]
@@ -29,6 +29,7 @@ class EnvVar(str, Enum):
     CURRENT_PROFILE_DIR = get_var("current_profile_dir")
     CURRENT_APP_DATA_DIR = get_var("current_app_data_dir")
     STATIC_FILES_DIR = get_var("static_files_dir")
+    YAML_MODEL_CACHE_DIR = get_var("yaml_model_cache_dir")
 
 
 def list_env_vars():
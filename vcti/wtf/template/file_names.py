@@ -6,21 +6,23 @@
 # This file is a property of Visual Collaboration Technologies Inc.
 # Unauthorized access, reproduction or redistribution of any kind is prohibited.
 
+from typing import Final
+
 
 class FileNames:
-    SOURCE_DIR = "source"
-    RUNS_DIR = "runs"
-    META_YAML = "meta.yaml"
-    VARIABLES_YAML = "variables.yaml"
-    STEPS_YAML = "steps.yaml"
-    APP_REQUIREMENTS = "app_requirements.yaml"
-    ROOT_NODE = ".entrypoint"
+    SOURCE_DIR: Final = "source"
+    RUNS_DIR: Final = "runs"
+    META_YAML: Final = "meta.yaml"
+    VARIABLES_YAML: Final = "variables.yaml"
+    STEPS_YAML: Final = "steps.yaml"
+    APP_REQUIREMENTS: Final = "app_requirements.yaml"
+    ROOT_NODE: Final = ".entrypoint"
 
-    RUNS_FOLDER = "runs"
-    ACTIVE_RUN_FILE = ".active"
-    DEFAULT_RUN_ID = "default"
-    RUN_STATUS_FILE = "status.json"
-    CONFIG_DIR = "config"
-    DIAGNOSTICS_DIR = "diagnostics"
-    OUTPUTS_DIR = "outputs"
-    ENV_FILE = ".env"
+    RUNS_FOLDER: Final = "runs"
+    ACTIVE_RUN_FILE: Final = ".active"
+    DEFAULT_RUN_ID: Final = "default"
+    RUN_STATUS_FILE: Final = "status.json"
+    CONFIG_DIR: Final = "config"
+    DIAGNOSTICS_DIR: Final = "diagnostics"
+    OUTPUTS_DIR: Final = "outputs"
+    ENV_FILE: Final = ".env"
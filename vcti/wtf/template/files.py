@@ -9,21 +9,28 @@
 TemplateFiles class provides methods to manage files in a template directory.
 """
 
+import os
+import posixpath
 import shutil
 from pathlib import Path
 from typing import Optional, Union
 
+import orjson
 from fastapi import UploadFile
 from starlette.responses import FileResponse, StreamingResponse
 
-from vcti.archive.directory_zip_memory_streamer import DirectoryZipMemoryStreamer
+from vcti.archive.directory_zip_streamer import DirectoryZipStreamer
 from vcti.archive.zip_extractor import ZipExtractor
+from vcti.util.fastcopy import copy_path, copy_stream_to_file
 from vcti.util.file_id_utils import FileId
-from vcti.util.path_tree import PathTree, get_path_tree
-from vcti.util.path_utils import FileNameValidator, validate_folder_access
+from vcti.util.path_tree import PathTreeData, get_path_tree_data, iter_path_tree
+from vcti.util.path_utils import FileNameValidator, validate_folder_access_cached
 
 from .utils import make_duplicate_name
 
+# Read size for single file downloads (Starlette's default is 64 KiB)
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
 
 class TemplateFiles:
     def __init__(self, template_path: Path):
@@ -36,7 +43,7 @@ class TemplateFiles:
         self.path = template_path.resolve()
 
         # Ensure that template_path exists and accessible
-        validate_folder_access(self.path)
+        validate_folder_access_cached(self.path)
 
     def resolve_path(
         self,
@@ -103,10 +110,15 @@ class TemplateFiles:
             self.path,
         )
 
+    @staticmethod
+    def _parent_file_id(file_id: str) -> str:
+        """Returns the file ID of the directory containing `file_id`."""
+        return posixpath.dirname(file_id.rstrip("/"))
+
     def get_directory_tree(
         self,
         file_id: Optional[str] = None,
-    ) -> PathTree:
+    ) -> PathTreeData:
         """
         Return the hierarchical structure of a directory within the template.
 
@@ -118,7 +130,7 @@ class TemplateFiles:
                 POSIX-style relative identifier for a directory under the template root.
 
         Returns:
-            PathTree: Hierarchical structure of files and directories under the given path.
+            PathTreeData: Hierarchical structure of files and directories under the given path.
 
         Raises:
             FileNotFoundError: If the resolved path does not exist.
@@ -126,13 +138,42 @@ class TemplateFiles:
         """
         file_path = self.resolve_path(file_id, must_be_dir=True)
 
-        return get_path_tree(
+        return get_path_tree_data(
             file_path,
             base_path=self.path.parent,
             as_posix=True,
             skip_root=True,
         )
 
+    def stream_directory_tree(
+        self,
+        file_id: Optional[str] = None,
+    ) -> StreamingResponse:
+        """
+        Stream the structure of a directory within the template as NDJSON.
+
+        Unlike `get_directory_tree`, the tree is never materialized in full: each
+        line of the response is one directory record (see `iter_path_tree`),
+        serialized with orjson as the directory is scanned.
+
+        Args:
+            file_id (Optional[str]):
+                POSIX-style relative identifier for a directory under the template root.
+
+        Returns:
+            StreamingResponse: Newline-delimited JSON, one directory per line.
+
+        Raises:
+            NotADirectoryError: If the resolved path is not a directory.
+        """
+        file_path = self.resolve_path(file_id, must_be_dir=True)
+        records = iter_path_tree(file_path, base_path=self.path.parent, as_posix=True)
+
+        return StreamingResponse(
+            content=(orjson.dumps(record) + b"\n" for record in records),
+            media_type="application/x-ndjson",
+        )
+
     def download_directory(
         self,
         file_id: Optional[str] = None,
@@ -160,7 +201,7 @@ class TemplateFiles:
             download_filename = f"{dir_path.name}.zip"
 
         return StreamingResponse(
-            content=DirectoryZipMemoryStreamer(dir_path),
+            content=DirectoryZipStreamer(dir_path),
             media_type="application/zip",
             headers={
                 "Content-Disposition": f'attachment; filename="{download_filename}"'
@@ -193,7 +234,16 @@ class TemplateFiles:
         if download_filename is None:
             download_filename = file_path.name
 
-        return FileResponse(file_path, filename=download_filename)
+        # Servers supporting the ASGI pathsend extension send the file by
+        # path themselves; otherwise it is read in large chunks. Passing the
+        # stat result spares the response another stat in the thread pool.
+        response = FileResponse(
+            file_path,
+            filename=download_filename,
+            stat_result=os.stat(file_path),
+        )
+        response.chunk_size = DOWNLOAD_CHUNK_SIZE
+        return response
 
     def download(
         self,
@@ -255,8 +305,11 @@ class TemplateFiles:
         if new_path.exists():
             raise FileExistsError(f"Target name already exists: {new_path}")
 
-        shutil.move(original_path, new_path)
-        return self.get_file_id(new_path)
+        is_dir = original_path.is_dir()
+
+        # Both paths are in the same directory, so this is a single rename(2)
+        os.replace(original_path, new_path)
+        return FileId.compose(self._parent_file_id(file_id), new_name, is_dir)
 
     def duplicate(
         self,
@@ -275,14 +328,11 @@ class TemplateFiles:
         new_name = make_duplicate_name(source_path)
         dest_path = source_path.with_name(new_name)
 
-        if source_path.is_file():
-            shutil.copy2(source_path, dest_path)
-        elif source_path.is_dir():
-            shutil.copytree(source_path, dest_path)
-        else:
-            raise RuntimeError(f"Cannot duplicate path: {source_path}")
+        copy_path(source_path, dest_path)
 
-        return self.get_file_id(dest_path)
+        return FileId.compose(
+            self._parent_file_id(file_id), new_name, source_path.is_dir()
+        )
 
     def upload(
         self,
@@ -313,32 +363,37 @@ class TemplateFiles:
         target_path = self.resolve_path(file_id)
         parent_dir = target_path.parent
 
-        if not parent_dir.exists():
-            if create_parents:
-                parent_dir.mkdir(parents=True, exist_ok=True)
-            else:
-                raise FileNotFoundError(
-                    f"Parent directory does not exist: {parent_dir}"
-                )
-
-        if target_path.exists() and not replace_existing:
-            raise FileExistsError(f'Target already exists: "{target_path}"')
-
-        # Attempt to rewind file stream if possible
+        # An existing target implies an existing parent, so a single lstat
+        # settles the common cases
         try:
-            file.file.seek(0)
-        except Exception:
-            pass
+            os.lstat(target_path)
+            target_exists = True
+        except (FileNotFoundError, NotADirectoryError):
+            target_exists = False
+
+        if target_exists:
+            if not replace_existing:
+                raise FileExistsError(f'Target already exists: "{target_path}"')
+        elif create_parents:
+            try:
+                os.mkdir(parent_dir)
+            except FileExistsError:
+                pass
+            except FileNotFoundError:
+                parent_dir.mkdir(parents=True, exist_ok=True)
+        elif not parent_dir.exists():
+            raise FileNotFoundError(
+                f"Parent directory does not exist: {parent_dir}"
+            )
 
         try:
             if is_directory:
                 # Expecting a zip file to be extracted into a directory
                 zip_extractor = ZipExtractor(file, target_path)
-                zip_extractor.extract_using_bytesio()
+                zip_extractor.extract_streaming()
             else:
                 # Upload as a regular file
-                with open(target_path, "wb") as out_file:
-                    shutil.copyfileobj(file.file, out_file)
+                copy_stream_to_file(file.file, target_path)
 
         except Exception as e:
             # Clean up if upload partially succeeded
@@ -352,7 +407,9 @@ class TemplateFiles:
                 pass  # Suppress secondary cleanup errors
             raise RuntimeError(f"Upload failed for '{file_id}': {e}")
 
-        return self.get_file_id(target_path)
+        return FileId.compose(
+            self._parent_file_id(file_id), target_path.name, is_directory
+        )
 
     def delete(
         self,
@@ -9,8 +9,11 @@
 TemplateRepository provides methods to manage template repositories.
 """
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 from fastapi import UploadFile
 
@@ -18,7 +21,29 @@ from vcti.archive.zip_extractor import ZipExtractor
 from vcti.util.git_repository_manager import GitRepositoryManager
 from vcti.util.short_uid import ShortUID
 
+from .file_names import FileNames
 from .template import Template
+from .workflow_nodes import WorkflowNodes
+
+# Upper bound on threads used to validate templates in list_templates
+LIST_TEMPLATES_MAX_WORKERS = 32
+
+# Shared by all repositories and created on first use, so importing this
+# module starts no threads; reused across listings instead of per call
+_listing_executor: Optional[ThreadPoolExecutor] = None
+_listing_executor_lock = threading.Lock()
+
+
+def _get_listing_executor() -> ThreadPoolExecutor:
+    """Returns the executor that validates templates, creating it if needed."""
+    global _listing_executor
+    with _listing_executor_lock:
+        if _listing_executor is None:
+            _listing_executor = ThreadPoolExecutor(
+                max_workers=LIST_TEMPLATES_MAX_WORKERS,
+                thread_name_prefix="list-templates",
+            )
+        return _listing_executor
 
 
 class TemplatesRepository:
@@ -26,6 +51,9 @@ class TemplatesRepository:
         self,
         local_repo_path: Union[str, Path],
         remote_repo_url: Optional[str] = None,
+        clone_depth: Optional[int] = None,
+        clone_filter: Optional[str] = None,
+        sparse_paths: Optional[List[str]] = None,
     ) -> None:
         """
         Manages a local template repository.
@@ -34,6 +62,9 @@ class TemplatesRepository:
         Args:
             local_repo_path (Union[str, Path]): Path to the local repository.
             remote_repo_url (Optional[str]): Remote Git repository URL.
+            clone_depth (Optional[int]): History depth for the initial clone (full if None).
+            clone_filter (Optional[str]): Partial clone filter, e.g. "tree:0".
+            sparse_paths (Optional[List[str]]): Directories to check out; all if None.
 
         Raises:
             ValueError: If the local path is not provided or the remote is required but missing.
@@ -41,16 +72,25 @@ class TemplatesRepository:
         if not local_repo_path:
             raise ValueError("Invalid local repository path. ")
 
-        self._repo_manager = GitRepositoryManager(
-            Path(local_repo_path).expanduser().resolve()
-        )
+        # GitRepositoryManager expands and resolves the path itself
+        self._repo_manager = GitRepositoryManager(local_repo_path)
 
         if not self._repo_manager.directory_path.exists():
             if not remote_repo_url:
                 raise ValueError(
                     "Local repository path does not exist and no remote repository URL was provided."
                 )
-            self._repo_manager.create_from_remote(remote_repo_url)
+            self._repo_manager.create_from_remote(
+                remote_repo_url,
+                depth=clone_depth,
+                filter_spec=clone_filter,
+                sparse_paths=sparse_paths,
+            )
+
+        # (repository directory mtime, subdirectory paths) of the last listing
+        self._listing_cache: Optional[Tuple[int, List[Path]]] = None
+        # Template directory -> (entrypoint file stamp, is valid template)
+        self._validity_cache: Dict[Path, Tuple[Tuple[int, int, int], bool]] = {}
 
     @property
     def directory_path(self) -> Path:
@@ -116,17 +156,27 @@ class TemplatesRepository:
         template_dir.mkdir(parents=True, exist_ok=False)
 
         zip_extractor = ZipExtractor(archive, template_dir)
-        zip_extractor.extract_using_bytesio()
+        zip_extractor.extract_streaming()
 
+        self._listing_cache = None
         return Template(template_dir)
 
-    def list_templates(self) -> List["Template"]:
+    def list_templates(self) -> Iterator["Template"]:
         """
         Lists all valid templates in the local repository.
         Skips directories that are not valid templates.
 
+        Directories are validated up front, but each Template object is only
+        created when the iterator reaches it, so a caller that stops early
+        does not pay for the rest.
+
+        The directory listing is reused while the repository directory's
+        modification time is unchanged, and each directory's validity is
+        reused while its entrypoint file is unchanged. Template objects are
+        always created fresh.
+
         Returns:
-            List[Template]: Templates that pass validation.
+            Iterator[Template]: Templates that pass validation.
 
         Usage:
             >>> repo = TemplateRepository("/path/to/repo")
@@ -134,14 +184,58 @@ class TemplatesRepository:
             >>> [t.name for t in templates]
             ['static-analysis-a03xb', 'modal_analysis-b04xc', ...]
         """
-        templates = []
-
-        for entry in self.directory_path.iterdir():
-            if not entry.is_dir():
-                continue
-
-            template = Template(entry)
-            if template.workflow_nodes.is_valid():
-                templates.append(template)
-
-        return templates
+        for template_dir in self._list_template_directories():
+            yield Template(template_dir)
+
+    def _list_template_directories(self) -> List[Path]:
+        """Returns the repository subdirectories that hold valid templates."""
+        directories = self._list_directories()
+        if len(directories) < 2:
+            flags = list(map(self._is_template_directory, directories))
+        else:
+            # Validation is dominated by file system calls, which release the GIL
+            flags = list(
+                _get_listing_executor().map(self._is_template_directory, directories)
+            )
+
+        return [path for path, is_valid in zip(directories, flags) if is_valid]
+
+    def _list_directories(self) -> List[Path]:
+        """Returns the subdirectories of the repository directory."""
+        mtime = os.stat(self.directory_path).st_mtime_ns
+        if self._listing_cache and self._listing_cache[0] == mtime:
+            return self._listing_cache[1]
+
+        with os.scandir(self.directory_path) as it:
+            # Hidden entries such as .git are never templates
+            directories = [
+                Path(entry.path)
+                for entry in it
+                if entry.name[0] != "." and entry.is_dir(follow_symlinks=False)
+            ]
+
+        self._listing_cache = (mtime, directories)
+        self._validity_cache = {
+            path: self._validity_cache[path]
+            for path in directories
+            if path in self._validity_cache
+        }
+        return directories
+
+    def _is_template_directory(self, template_dir: Path) -> bool:
+        """Checks whether a directory holds a valid workflow template."""
+        entrypoint = template_dir / FileNames.SOURCE_DIR / FileNames.ROOT_NODE
+        try:
+            st = os.stat(entrypoint)
+        except OSError:
+            # Without an entrypoint there is no root node
+            return False
+
+        stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = self._validity_cache.get(template_dir)
+        if cached and cached[0] == stamp:
+            return cached[1]
+
+        is_valid = bool(WorkflowNodes(template_dir).is_valid())
+        self._validity_cache[template_dir] = (stamp, is_valid)
+        return is_valid
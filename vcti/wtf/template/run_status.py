@@ -10,11 +10,14 @@ RunStatusManager handles reading and writing run status information
 to a `status.json` file at the root of a run directory.
 """
 
-import json
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+from pydantic_core import to_json
 
 from vcti.util.value_generated_enums import EnumValueSameAsName, auto_enum_value
 
@@ -43,6 +46,65 @@ class RunStatus(BaseModel):
     message: Optional[str] = None
 
 
+# Compiled once; validates status JSON in pydantic-core
+_RUN_STATUS_ADAPTER = TypeAdapter(RunStatus)
+
+# Serialized form of RunStatus; same layout as `dump_json(status, indent=2)`
+_STATUS_JSON_FORMAT = b'{\n  "state": "%s",\n  "pid": %s,\n  "message": %s\n}'
+
+
+def _dump_status(status: RunStatus) -> bytes:
+    """
+    Serializes a RunStatus without going through the model serializer.
+
+    The model has three scalar fields, so the JSON is formatted directly;
+    only the message needs escaping, which pydantic-core does exactly as the
+    model serializer would.
+    """
+    return _STATUS_JSON_FORMAT % (
+        RunState(status.state).value.encode(),
+        b"null" if status.pid is None else b"%d" % status.pid,
+        b"null" if status.message is None else to_json(status.message),
+    )
+
+
+# Status file name relative to a run directory
+_STATUS_REL = FileNames.RUN_STATUS_FILE
+
+# Number of parsed status files kept in memory
+STATUS_CACHE_SIZE = 1024
+
+# Parsed status files, least recently used first:
+# path -> (st_mtime_ns, st_size, status)
+_status_cache: "OrderedDict[str, Tuple[int, int, RunStatus]]" = OrderedDict()
+_status_cache_lock = threading.Lock()
+
+
+def _cached_status(key: str, st: os.stat_result) -> Optional[RunStatus]:
+    """Returns the cached status for `key` if it matches the file's stat result."""
+    with _status_cache_lock:
+        cached = _status_cache.get(key)
+        if not cached or cached[0] != st.st_mtime_ns or cached[1] != st.st_size:
+            return None
+        _status_cache.move_to_end(key)
+    return cached[2]
+
+
+def _remember_status(key: str, st: os.stat_result, status: RunStatus) -> None:
+    """Caches `status` for `key`, evicting the least recently used entry if full."""
+    with _status_cache_lock:
+        _status_cache[key] = (st.st_mtime_ns, st.st_size, status)
+        _status_cache.move_to_end(key)
+        if len(_status_cache) > STATUS_CACHE_SIZE:
+            _status_cache.popitem(last=False)
+
+
+def _forget_status(key: str) -> None:
+    """Drops the cached status for `key`, if any."""
+    with _status_cache_lock:
+        _status_cache.pop(key, None)
+
+
 class RunStatusManager:
     """
     Manages run status persistence using a `status.json` file.
@@ -59,28 +121,48 @@ class RunStatusManager:
             run_dir (Path): Path to the root directory of the run.
         """
         self.run_dir = run_dir
-        self.status_file = run_dir / FileNames.RUN_STATUS_FILE
+        self._status_path = os.path.join(run_dir, _STATUS_REL)
+
+    @property
+    def status_file(self) -> Path:
+        """Returns the path to the status file."""
+        return Path(self._status_path)
 
     def exists(self) -> bool:
         """Returns True if the status file exists."""
-        return self.status_file.exists()
+        return os.path.exists(self._status_path)
 
     def load(self) -> RunStatus:
         """
         Loads the run status from the status file.
 
+        The parsed status is cached per file (up to STATUS_CACHE_SIZE files)
+        and reused while the file's modification time and size are unchanged,
+        so repeated loads cost a single `stat`.
+
         Returns:
             RunStatus: Parsed status object. Defaults to NOT_STARTED if missing or corrupt.
         """
-        if not self.status_file.exists():
+        key = self._status_path
+        try:
+            st = os.stat(key)
+        except FileNotFoundError:
+            _forget_status(key)
             return RunStatus()
 
+        cached = _cached_status(key, st)
+        if cached is not None:
+            return cached.model_copy()
+
         try:
-            data = json.loads(self.status_file.read_text(encoding="utf-8"))
-            return RunStatus(**data)
+            with open(key, "rb") as file:
+                status = _RUN_STATUS_ADAPTER.validate_json(file.read())
         except Exception:
             return RunStatus()  # fallback to default if parsing fails
 
+        _remember_status(key, st, status)
+        return status.model_copy()
+
     def save(self, status: RunStatus) -> None:
         """
         Saves the run status to the status file.
@@ -88,7 +170,11 @@ class RunStatusManager:
         Args:
             status (RunStatus): The status to save.
         """
-        self.status_file.write_text(status.model_dump_json(indent=2), encoding="utf-8")
+        with open(self._status_path, "wb") as file:
+            file.write(_dump_status(status))
+
+        st = os.stat(self._status_path)
+        _remember_status(self._status_path, st, status.model_copy())
 
     def update(
         self,
@@ -16,8 +16,10 @@ stores its status (`status.json`), configuration (`config/`), diagnostics
 import os
 import shutil
 import subprocess
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from dotenv import dotenv_values
 
@@ -26,6 +28,27 @@ from vcti.util.short_uid import ShortUID
 from .file_names import FileNames
 from .run_status import RunState, RunStatus, RunStatusManager
 
+# File names used on every run operation, bound once at import
+_RUNS_DIR = FileNames.RUNS_DIR
+_DEFAULT_RUN_ID = FileNames.DEFAULT_RUN_ID
+_ACTIVE_RUN_FILE = FileNames.ACTIVE_RUN_FILE
+# Location of a run's environment file relative to the run directory
+_ENV_REL = os.path.join(FileNames.CONFIG_DIR, FileNames.ENV_FILE)
+
+
+@lru_cache(maxsize=128)
+def _cached_dotenv(
+    path: str, mtime_ns: int, size: int
+) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """
+    Parses a .env file, reusing the result while the file is unchanged.
+
+    The modification time and size are part of the cache key, so an edited
+    file is parsed again. Items are returned as a tuple so that the cached
+    value cannot be modified by callers.
+    """
+    return tuple(dotenv_values(path).items())
+
 
 class TemplateRuns:
     def __init__(self, template_path: Path):
@@ -34,18 +57,21 @@ class TemplateRuns:
             template_path (Path): Absolute path to the template directory.
         """
         self._path = template_path
-        self._runs_dir = self._path / FileNames.RUNS_DIR
+        self._runs_dir = self._path / _RUNS_DIR
         self._runs_dir.mkdir(exist_ok=True)
+        # String forms of fixed paths, used directly with os functions
+        self._runs_dir_str = os.fspath(self._runs_dir)
+        self._active_run_file = os.path.join(self._runs_dir_str, _ACTIVE_RUN_FILE)
+        # Run ID -> status manager of that run
+        self._status_managers: Dict[str, RunStatusManager] = {}
         self._initialize_default_run()
 
     def _initialize_default_run(self):
-        default_run_path = self._get_run_path(FileNames.DEFAULT_RUN_ID)
-        if not default_run_path.exists():
-            self.create_run(FileNames.DEFAULT_RUN_ID)
+        if not os.path.exists(os.path.join(self._runs_dir_str, _DEFAULT_RUN_ID)):
+            self.create_run(_DEFAULT_RUN_ID)
 
-        active_run_file = self._get_active_run_file_path()
-        if not active_run_file.exists():
-            self.set_active_run(FileNames.DEFAULT_RUN_ID)
+        if not os.path.exists(self._active_run_file):
+            self.set_active_run(_DEFAULT_RUN_ID)
 
     def get_all_runs(self) -> List[str]:
         """
@@ -54,7 +80,8 @@ class TemplateRuns:
         Returns:
             List[str]: A list of run IDs (folder names).
         """
-        return [d.name for d in self._runs_dir.iterdir() if d.is_dir()]
+        with os.scandir(self._runs_dir) as it:
+            return [entry.name for entry in it if entry.is_dir(follow_symlinks=False)]
 
     def has_run(self, run_id: str) -> bool:
         """
@@ -66,14 +93,19 @@ class TemplateRuns:
         Returns:
             bool: True if the run exists, False otherwise.
         """
-        return self._get_run_path(run_id).exists()
-
-    def _get_active_run_file_path(self) -> Path:
-        return self._runs_dir / FileNames.ACTIVE_RUN_FILE
+        return os.path.exists(os.path.join(self._runs_dir_str, run_id))
 
     def _get_run_path(self, run_id: str) -> Path:
         return self._runs_dir / run_id
 
+    def _get_status_manager(self, run_id: str) -> RunStatusManager:
+        """Returns the status manager of a run, creating it on first use."""
+        status_mgr = self._status_managers.get(run_id)
+        if status_mgr is None:
+            status_mgr = RunStatusManager(self._get_run_path(run_id))
+            self._status_managers[run_id] = status_mgr
+        return status_mgr
+
     def _ensure_run_exists(self, run_id: str):
         self._get_run_path(run_id).mkdir(parents=True, exist_ok=True)
 
@@ -81,8 +113,8 @@ class TemplateRuns:
         """
         Returns the currently active run ID.
         """
-        path = self._get_active_run_file_path()
-        return path.read_text(encoding="utf-8").strip()
+        with open(self._active_run_file, encoding="utf-8") as file:
+            return file.read().strip()
 
     def set_active_run(self, run_id: str) -> None:
         """
@@ -92,7 +124,8 @@ class TemplateRuns:
             run_id (str): ID of the run to make active.
         """
         self._ensure_run_exists(run_id)
-        self._get_active_run_file_path().write_text(run_id, encoding="utf-8")
+        with open(self._active_run_file, "w", encoding="utf-8") as file:
+            file.write(run_id)
 
     def create_run(self, run_id: Optional[str] = None) -> str:
         """
@@ -112,7 +145,7 @@ class TemplateRuns:
             raise FileExistsError(f"Run already exists: {run_id}")
 
         run_path.mkdir(parents=True)
-        RunStatusManager(run_path).save(RunStatus(state=RunState.NOT_STARTED))
+        self._get_status_manager(run_id).save(RunStatus(state=RunState.NOT_STARTED))
         return run_id
 
     def get_run_status(self, run_id: str) -> RunStatus:
@@ -125,8 +158,7 @@ class TemplateRuns:
         Returns:
             RunStatus: The status object.
         """
-        run_path = self._get_run_path(run_id)
-        return RunStatusManager(run_path).load()
+        return self._get_status_manager(run_id).load()
 
     def _get_run_process_args(self, run_path: Path) -> list[str]:
         """
@@ -161,7 +193,7 @@ class TemplateRuns:
         """
         run_id = run_id or self.get_active_run()
         run_path = self._get_run_path(run_id)
-        status_mgr = RunStatusManager(run_path)
+        status_mgr = self._get_status_manager(run_id)
         status = status_mgr.load()
 
         if status.state != RunState.NOT_STARTED:
@@ -169,10 +201,17 @@ class TemplateRuns:
                 f"Run '{run_id}' is not in NOT_STARTED state. Current state: {status.state}"
             )
 
-        env_file = run_path / FileNames.CONFIG_DIR / FileNames.ENV_FILE
-        env = os.environ.copy()
-        if env_file.exists():
-            env.update(dotenv_values(env_file))
+        # Without a .env file the child simply inherits the environment
+        env_file = os.path.join(run_path, _ENV_REL)
+        try:
+            env_stat = os.stat(env_file)
+        except FileNotFoundError:
+            env = None
+        else:
+            env_items = _cached_dotenv(
+                env_file, env_stat.st_mtime_ns, env_stat.st_size
+            )
+            env = {**os.environ, **dict(env_items)}
 
         process_args = self._get_run_process_args(run_path)
 
@@ -192,7 +231,8 @@ class TemplateRuns:
         """
         run_id = run_id or self.get_active_run()
         run_path = self._get_run_path(run_id)
-        status = RunStatusManager(run_path).load()
+        status_mgr = self._get_status_manager(run_id)
+        status = status_mgr.load()
 
         if (
             status.state == RunState.RUNNING
@@ -201,17 +241,13 @@ class TemplateRuns:
         ):
             raise RuntimeError(f"Cannot clear running run: {run_id}")
 
-        # Delete contents, preserve the folder
-        for item in run_path.iterdir():
-            if item.name == "status.json":
-                continue  # Preserve status file
-            if item.is_dir():
-                shutil.rmtree(item)
-            else:
-                item.unlink()
+        # The status file is rewritten below, so the whole folder is removed
+        # in one traversal and recreated empty
+        shutil.rmtree(run_path)
+        run_path.mkdir(parents=True)
 
         # Reset status
-        RunStatusManager(run_path).save(RunStatus(state=RunState.NOT_STARTED))
+        status_mgr.save(RunStatus(state=RunState.NOT_STARTED))
 
     def _pid_exists(self, pid: int) -> bool:
         """
@@ -223,6 +259,12 @@ class TemplateRuns:
         Returns:
             bool: True if process exists, False otherwise.
         """
+        if pid <= 0:
+            # 0 and negative values address process groups, not a process
+            return False
+        if sys.platform == "linux":
+            return os.path.exists(f"/proc/{pid}")
+
         try:
             os.kill(pid, 0)
         except ProcessLookupError:
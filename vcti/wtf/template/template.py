@@ -9,18 +9,27 @@
 Template class provides methods to manage individual templates in a repository.
 """
 
+import os
 import shutil
 from pathlib import Path
 
 from starlette.responses import StreamingResponse
 
-from vcti.util.path_utils import FileNameValidator, validate_folder_access
+from vcti.util.fastcopy import reflink_tree
+from vcti.util.path_utils import (
+    FileNameValidator,
+    invalidate_folder_access,
+    validate_folder_access_cached,
+)
 
 from .files import TemplateFiles
 from .runs import TemplateRuns
 from .utils import make_duplicate_name
 from .workflow_nodes import WorkflowNodes
 
+# Number of random IDs tried before duplicate gives up
+DUPLICATE_NAME_ATTEMPTS = 5
+
 
 class Template:
     def __init__(self, template_path: Path):
@@ -33,7 +42,7 @@ class Template:
         Raises:
             ValueError: If the provided path does not exist or is not a directory.
         """
-        validate_folder_access(template_path)
+        validate_folder_access_cached(template_path)
 
         self.path = template_path
         self.files = TemplateFiles(template_path)
@@ -65,14 +74,28 @@ class Template:
 
         Returns:
             Template: A new Template instance with the duplicated content.
+
+        Raises:
+            FileExistsError: If no unused template ID could be generated.
         """
-        while True:
-            new_id = make_duplicate_name(Path(self.id))
-            new_path = self.path.parent / new_id
-            if not new_path.exists():
+        # Creating the directory both checks and claims the new ID
+        for _ in range(DUPLICATE_NAME_ATTEMPTS):
+            new_path = self.path.parent / make_duplicate_name(Path(self.id))
+            try:
+                os.mkdir(new_path)
                 break
-
-        shutil.copytree(self.path, new_path)
+            except FileExistsError:
+                continue
+        else:
+            raise FileExistsError(
+                f"Could not generate an unused ID for a copy of '{self.id}'."
+            )
+
+        try:
+            reflink_tree(self.path, new_path, dirs_exist_ok=True)
+        except BaseException:
+            shutil.rmtree(new_path, ignore_errors=True)
+            raise
         return Template(new_path)
 
     def rename(self, new_id: str) -> "Template":
@@ -99,10 +122,13 @@ class Template:
         if new_path.exists():
             raise FileExistsError(f"Template ID '{new_id}' already exists.")
 
-        shutil.move(self.path, new_path)
+        # Templates share a parent directory, so this is a single rename(2)
+        os.replace(self.path, new_path)
+        self._invalidate_access_cache()
         self.path = new_path
         # Update managers with new path
         self.files = TemplateFiles(self.path)
+        self.workflow_nodes = WorkflowNodes(self.path)
         return self
 
     def delete(self) -> None:
@@ -110,3 +136,9 @@ class Template:
         Deletes the template directory and all its contents.
         """
         shutil.rmtree(self.path)
+        self._invalidate_access_cache()
+
+    def _invalidate_access_cache(self) -> None:
+        """Forgets cached access checks for the current template path."""
+        invalidate_folder_access(self.path)
+        invalidate_folder_access(self.files.path)
@@ -10,14 +10,36 @@
 Provides access to workflow node definitions and associated metadata within a template.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+from pydantic import TypeAdapter
 
 from ..variable.list import Variables
-from ..yaml_reader import read_model, root_locator
+from ..yaml_reader import load_yaml, read_model, root_locator
 from .file_names import FileNames
 from .metadata import Metadata
 
+# Upper bound on threads used to load the files of several nodes at once
+LOAD_ALL_MAX_WORKERS = 8
+
+# Validates the metadata of all nodes in a single call
+_METADATA_MAP_ADAPTER = TypeAdapter(Dict[str, Metadata])
+
+# Files a workflow node directory may contain
+_NODE_FILES = (FileNames.META_YAML, FileNames.VARIABLES_YAML, FileNames.STEPS_YAML)
+
+
+class NodePaths(NamedTuple):
+    """Paths of the files of a workflow node."""
+
+    meta: Path
+    variables: Path
+    steps: Path
+
 
 class WorkflowNodes:
     """
@@ -29,6 +51,10 @@ class WorkflowNodes:
       - steps.yaml        → Execution steps for the node
 
     An `.entrypoint` file inside the 'source' directory indicates the root node.
+
+    The root node name and its metadata and variables are read on first access
+    and then kept for the lifetime of the instance; create a new instance to
+    pick up later changes to those files.
     """
 
     def __init__(self, path: Path):
@@ -38,28 +64,31 @@ class WorkflowNodes:
         Args:
             path (Path): Path to the template root directory.
         """
-        self._path = path
+        # Resolved once, so node file paths can skip resolution when loaded
+        self._path = path.resolve()
         self._source_dir = self._path / FileNames.SOURCE_DIR
         self._runs_dir = self._path / FileNames.RUNS_DIR
-        self._root_node = self._read_root_node()
-        self._meta = None
+        self._source_dir_str = os.fspath(self._source_dir)
+        # Node name -> presence of each node file, as seen by iter_nodes
+        self._node_files: Dict[str, Dict[str, bool]] = {}
+        # Node name -> paths of its files
+        self._node_paths: Dict[str, NodePaths] = {}
 
-    @property
+    @cached_property
     def root_node(self) -> Optional[str]:
         """Returns the root node identifier (folder name), or None if not defined."""
-        return self._root_node
-
-    def _root_node_file_path(self) -> Path:
-        """Returns the path to the .entrypoint file."""
-        return self._source_dir / FileNames.ROOT_NODE
+        return self._read_root_node()
 
     def _read_root_node(self) -> Optional[str]:
         """Reads the entrypoint file to determine the root workflow node name."""
-        root_node_file = self._root_node_file_path()
-        if not root_node_file.exists():
+        root_node_file = os.path.join(self._source_dir_str, FileNames.ROOT_NODE)
+        try:
+            with open(root_node_file, "rb") as file:
+                content = file.read()
+        except (FileNotFoundError, NotADirectoryError):
             return None
 
-        return root_node_file.read_text(encoding="utf-8").strip()
+        return content.decode("utf-8").strip() or None
 
     def is_valid(self) -> bool:
         """
@@ -68,20 +97,73 @@ class WorkflowNodes:
         Returns:
             bool: True if an root node is defined and its metadata file exists.
         """
-        if not self._root_node:
+        if not self.root_node:
             return False
         return self._meta_file_path(self.root_node)
 
+    def clear_node_files_cache(self) -> None:
+        """
+        Forgets the node file presence recorded by `iter_nodes`, e.g. after
+        node files have been added or removed.
+        """
+        self._node_files.clear()
+
+    def iter_nodes(self) -> Iterator[Tuple[str, Dict[str, bool]]]:
+        """
+        Iterates over the workflow nodes under the 'source' directory.
+
+        Each node directory is listed once with `os.scandir` and the presence
+        of its files is taken from that listing. The result is remembered, so
+        later `node_metadata` and `node_variables` calls skip files that are
+        known to be absent.
+
+        Yields:
+            Tuple[str, Dict[str, bool]]: Node name and a map from node file name
+            (meta.yaml, variables.yaml, steps.yaml) to whether it is present.
+        """
+        try:
+            with os.scandir(self._source_dir_str) as it:
+                node_dirs = [
+                    entry for entry in it if entry.name[0] != "." and entry.is_dir()
+                ]
+        except FileNotFoundError:
+            return
+
+        for node_dir in node_dirs:
+            with os.scandir(node_dir.path) as it:
+                file_names = {entry.name for entry in it if entry.is_file()}
+            present = {name: name in file_names for name in _NODE_FILES}
+            self._node_files[node_dir.name] = present
+            yield node_dir.name, present
+
+    def _is_known_absent(self, node_name: str, file_name: str) -> bool:
+        """Returns True if iter_nodes found that the node has no such file."""
+        present = self._node_files.get(node_name)
+        return present is not None and not present[file_name]
+
     # File path access methods
 
+    def _get_node_paths(self, node_name: str) -> NodePaths:
+        """Returns the file paths of a node, building them on first use."""
+        paths = self._node_paths.get(node_name)
+        if paths is None:
+            node_dir = os.path.join(self._source_dir_str, node_name)
+            paths = NodePaths(
+                meta=Path(os.path.join(node_dir, FileNames.META_YAML)),
+                variables=Path(os.path.join(node_dir, FileNames.VARIABLES_YAML)),
+                steps=Path(os.path.join(node_dir, FileNames.STEPS_YAML)),
+            )
+            self._node_paths[node_name] = paths
+        return paths
+
     def _meta_file_path(self, node_name: str) -> Path:
-        return self._source_dir / node_name / FileNames.META_YAML
+        return self._get_node_paths(node_name).meta
 
     def _variables_file_path(self, node_name: str) -> Path:
-        return self._source_dir / node_name / FileNames.VARIABLES_YAML
+        return self._get_node_paths(node_name).variables
 
     def _steps_file_path(self, node_name: str) -> Path:
-        return self._source_dir / node_name / FileNames.STEPS_YAML
+        return self._get_node_paths(node_name).steps
 
     def node_metadata(self, node_name: str) -> Optional[Metadata]:
         """
@@ -96,12 +178,16 @@ class WorkflowNodes:
         Raises:
             RuntimeError: If YAML parsing fails.
         """
-        meta_file = self._meta_file_path(node_name)
-        if not meta_file.exists():
+        if self._is_known_absent(node_name, FileNames.META_YAML):
             return None
 
+        meta_file = self._meta_file_path(node_name)
         try:
-            return read_model(meta_file, root_locator, Metadata)
+            return read_model(
+                meta_file, root_locator, Metadata, assume_resolved=True, quiet=True
+            )
+        except FileNotFoundError:
+            return None
         except Exception as e:
             raise RuntimeError(f'Failed to parse metadata file "{meta_file}": {str(e)}')
 
@@ -118,24 +204,84 @@ class WorkflowNodes:
         Raises:
             RuntimeError: If YAML parsing fails.
         """
-        variables_file = self._variables_file_path(node_name)
-        if not variables_file.exists():
+        if self._is_known_absent(node_name, FileNames.VARIABLES_YAML):
             return Variables(root=[])
 
+        variables_file = self._variables_file_path(node_name)
         try:
-            return read_model(variables_file, root_locator, Variables)
+            return read_model(
+                variables_file, root_locator, Variables, assume_resolved=True, quiet=True
+            )
+        except FileNotFoundError:
+            return Variables(root=[])
         except Exception as e:
             raise RuntimeError(
                 f'Failed to parse variables file "{variables_file}": {str(e)}'
             )
 
+    def load_all_variables(self, node_names: Iterable[str]) -> Dict[str, Variables]:
+        """
+        Loads the variables of several workflow nodes concurrently.
+
+        Args:
+            node_names (Iterable[str]): Names of the workflow nodes.
+
+        Returns:
+            Dict[str, Variables]: Variables of each node, keyed by node name.
+
+        Raises:
+            RuntimeError: If YAML parsing fails for any node.
+        """
+        names = list(dict.fromkeys(node_names))
+        if len(names) < 2:
+            return {name: self.node_variables(name) for name in names}
+
+        # Loading is dominated by file reads, which release the GIL
+        workers = min(LOAD_ALL_MAX_WORKERS, len(names))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(names, executor.map(self.node_variables, names)))
+
+    def all_metadata(self) -> Dict[str, Metadata]:
+        """
+        Loads the metadata of every workflow node that has a metadata file.
+
+        Nodes are found with `iter_nodes`, their metadata files are parsed
+        concurrently, and the results are validated together in one pass.
+
+        Returns:
+            Dict[str, Metadata]: Metadata of each node, keyed by node name.
+
+        Raises:
+            RuntimeError: If YAML parsing or validation fails.
+        """
+        meta_files = {
+            name: self._meta_file_path(name)
+            for name, present in self.iter_nodes()
+            if present[FileNames.META_YAML]
+        }
+        if not meta_files:
+            return {}
+
+        def load(meta_file: Path) -> Any:
+            return load_yaml(meta_file, assume_resolved=True)
+
+        try:
+            workers = min(LOAD_ALL_MAX_WORKERS, len(meta_files))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                raw = dict(zip(meta_files, executor.map(load, meta_files.values())))
+            return _METADATA_MAP_ADAPTER.validate_python(raw)
+        except Exception as e:
+            raise RuntimeError(
+                f'Failed to parse metadata files under "{self._source_dir}": {str(e)}'
+            )
+
     def metadata(self) -> Optional[Metadata]:
         """Returns the metadata for the root workflow node.
 
         Returns:
             Optional[Metadata]: Parsed metadata model for the root node, or None if not defined.
         """
-        return self.node_metadata(self.root_node) if self.root_node else None
+        return self._root_metadata
 
     def variables(self) -> Variables:
         """Returns the variables for the root workflow node.
@@ -143,6 +289,14 @@ class WorkflowNodes:
         Returns:
             Variables: Parsed variables model for the root node, or an empty one if not defined.
         """
+        return self._root_variables
+
+    @cached_property
+    def _root_metadata(self) -> Optional[Metadata]:
+        return self.node_metadata(self.root_node) if self.root_node else None
+
+    @cached_property
+    def _root_variables(self) -> Variables:
         return (
             self.node_variables(self.root_node)
             if self.root_node
@@ -33,7 +33,7 @@ class Variable(BaseModel):
         default=VARIABLE_TYPE_CODER.default,
         description=f'The type of the variable. Supported values: {"/".join(VARIABLE_TYPE_CODER.list)}. Default: {VARIABLE_TYPE_CODER.default}.',
     )
-    value: Optional[Any] = Field(
+    value: Any = Field(
         default=None,
         description="The current value of the variable. If not provided, the default value will be used.",
     )
@@ -7,8 +7,16 @@
 # Unauthorized access, reproduction or redistribution of any kind is prohibited.
 """YAML file reader with support for VCollab workflow templates framework specific directives."""
 
+import copy
+import hashlib
+import os
+import pickle
+import stat
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
 
 import yaml
 import yaml_include
@@ -17,10 +25,30 @@ from yaml import YAMLError
 
 from vcti.logging import logger
 
+from .env_vars import EnvVar
 from .varref import VariableReference
 
 # Constants
 DEFAULT_INCLUDE_CMDS = ["include"]
+YAML_CACHE_SIZE = 256
+# Largest YAML file load_yaml reads into memory
+MAX_YAML_FILE_SIZE = 100 << 20
+
+# libyaml-backed loader when PyYAML was built with it; same tags as FullLoader
+YAML_LOADER = getattr(yaml, "CFullLoader", yaml.FullLoader)
+
+# (resolved path, include commands) -> ((st_mtime_ns, st_size), parsed data)
+_CacheKey = Tuple[str, Tuple[str, ...]]
+_yaml_cache: "OrderedDict[_CacheKey, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+# Guards lookups, reordering and eviction of the module caches across threads
+_cache_lock = threading.Lock()
+
+
+def clear_cache() -> None:
+    """Forgets all YAML files parsed by `load_yaml` and models read by `read_model`."""
+    with _cache_lock:
+        _yaml_cache.clear()
+        _model_cache.clear()
 
 
 def variable_constructor(loader: yaml.FullLoader, node: yaml.Node) -> VariableReference:
@@ -28,16 +56,54 @@ def variable_constructor(loader: yaml.FullLoader, node: yaml.Node) -> VariableRe
     var_name = node.value.strip()
     if not var_name:
         raise ValueError("Empty variable reference found in YAML.")
-    return VariableReference(var_name=var_name)
+    # A non-empty scalar string is all the model would validate
+    return VariableReference.model_construct(var_name=var_name)
+
 
+class _WorkflowLoader(YAML_LOADER):
+    """YAML loader with the !var tag; include tags are added by `_loader_for`."""
 
-def load_yaml(yaml_file_path: Path, include_cmds: Optional[List[str]] = None) -> Any:
+
+_WorkflowLoader.add_constructor("!var", variable_constructor)
+
+
+@lru_cache(maxsize=YAML_CACHE_SIZE)
+def _loader_for(base_dir: str, include_cmds: Tuple[str, ...]) -> Type[_WorkflowLoader]:
+    """
+    Returns a loader class that resolves include directives relative to `base_dir`.
+
+    Each base directory gets its own subclass, so constructors are registered
+    once per directory instead of on every load, and loads from different
+    directories never share include state.
+    """
+    loader = type("_WorkflowIncludeLoader", (_WorkflowLoader,), {})
+    include_constructor = yaml_include.Constructor(base_dir=base_dir)
+    for cmd in include_cmds:
+        loader.add_constructor(f"!{cmd}", include_constructor)
+    return loader
+
+
+def load_yaml(
+    yaml_file_path: Path,
+    include_cmds: Optional[List[str]] = None,
+    assume_resolved: bool = False,
+    quiet: bool = False,
+) -> Any:
     """
     Loads a YAML file with support for custom include directives and !var tags.
 
+    Parsed files are cached and reused while their modification time and size
+    are unchanged; callers receive a deep copy. Files that use an include
+    directive are always parsed again, since their included files may have
+    changed.
+
     Args:
         yaml_file_path: The path to the YAML file.
         include_cmds: A list of include command names. Defaults to ['include'].
+        assume_resolved: If True, the caller guarantees that the path is already
+            absolute and free of symbolic links, and it is not resolved again.
+        quiet: If True, a missing file is not logged as an error. Used for
+            optional files; FileNotFoundError is raised either way.
 
     Returns:
         The parsed YAML data as a Python dictionary or list.
@@ -45,35 +111,45 @@ def load_yaml(yaml_file_path: Path, include_cmds: Optional[List[str]] = None) ->
     Raises:
         FileNotFoundError: If the specified YAML file does not exist.
         yaml.YAMLError: If there is an error parsing the YAML file.
+        ValueError: If the file is larger than MAX_YAML_FILE_SIZE.
         Exception: For any other unexpected errors.
     """
     if include_cmds is None:
         include_cmds = DEFAULT_INCLUDE_CMDS
 
-    yaml_file_path = yaml_file_path.resolve()
-    if not yaml_file_path.exists():
-        logger.error('YAML file not found: "%s"', yaml_file_path)
+    if not assume_resolved:
+        yaml_file_path = yaml_file_path.resolve()
+    try:
+        st = os.stat(yaml_file_path)
+    except FileNotFoundError:
+        if not quiet:
+            logger.error('YAML file not found: "%s"', yaml_file_path)
         raise FileNotFoundError(f"YAML file not found: {yaml_file_path}")
 
-    base_dir = yaml_file_path.parent
-    loader = yaml.FullLoader
-
-    # Remove existing constructors to prevent conflicts
-    for cmd in include_cmds:
-        yaml_tag = f"!{cmd}"
-        loader.yaml_constructors.pop(yaml_tag, None)
-
-    # Register the include constructor
-    include_constructor = yaml_include.Constructor(base_dir=base_dir)
-    for cmd in include_cmds:
-        yaml.add_constructor(f"!{cmd}", include_constructor, loader)
-
-    # Register the !var constructor
-    yaml.add_constructor("!var", variable_constructor, loader)
+    key = (str(yaml_file_path), tuple(include_cmds))
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _cache_lock:
+        cached = _yaml_cache.get(key)
+        if cached and cached[0] == stamp:
+            _yaml_cache.move_to_end(key)
+        else:
+            cached = None
+    if cached:
+        return copy.deepcopy(cached[1])
+
+    if st.st_size > MAX_YAML_FILE_SIZE:
+        logger.error('YAML file too large: "%s" (%d bytes)', yaml_file_path, st.st_size)
+        raise ValueError(
+            f"YAML file exceeds {MAX_YAML_FILE_SIZE} bytes: {yaml_file_path}"
+        )
+
+    loader = _loader_for(str(yaml_file_path.parent), key[1])
 
     try:
-        with yaml_file_path.open("r", encoding="utf-8") as file:
-            return yaml.load(file, Loader=loader)
+        # The whole file is handed to the parser as one buffer, so libyaml
+        # scans it without calling back into Python for more input
+        content = yaml_file_path.read_bytes()
+        data = yaml.load(content, Loader=loader)
     except yaml.YAMLError as err:
         logger.error('YAML parsing error in "%s": %s', yaml_file_path, err)
         raise
@@ -84,6 +160,14 @@ def load_yaml(yaml_file_path: Path, include_cmds: Optional[List[str]] = None) ->
         logger.error('Unexpected error reading "%s": %s', yaml_file_path, err)
         raise
 
+    if not any(f"!{cmd}".encode() in content for cmd in include_cmds):
+        entry = (stamp, copy.deepcopy(data))
+        with _cache_lock:
+            _yaml_cache[key] = entry
+            if len(_yaml_cache) > YAML_CACHE_SIZE:
+                _yaml_cache.popitem(last=False)
+    return data
+
 
 def root_locator(data: Any) -> Any:
     """Locator function that returns the entire data."""
@@ -102,21 +186,165 @@ def section_locator(section: str) -> Any:
 # Generic type for Pydantic models
 ModelType = TypeVar("ModelType", bound=BaseModel)
 
+# (resolved path, model class, data locator) -> ((st_mtime_ns, st_size), model)
+_ModelCacheKey = Tuple[str, Type[BaseModel], Callable[[Any], Any]]
+_model_cache: "OrderedDict[_ModelCacheKey, Tuple[Tuple[int, int], BaseModel]]" = (
+    OrderedDict()
+)
+
+
+def _remember_model(
+    key: _ModelCacheKey, stamp: Tuple[int, int], model: BaseModel
+) -> None:
+    """
+    Adds a validated model to the in-memory model cache.
+
+    The cache keeps `model` itself, so callers must hand out copies of it.
+    """
+    with _cache_lock:
+        _model_cache[key] = (stamp, model)
+        if len(_model_cache) > YAML_CACHE_SIZE:
+            _model_cache.popitem(last=False)
+
+
+def _model_sidecar_path(
+    key: _ModelCacheKey, stamp: Tuple[int, int]
+) -> Optional[str]:
+    """
+    Returns where a validated model is persisted across processes, or None if
+    persisting is disabled.
+
+    Models are only persisted when the directory named by the
+    YAML_MODEL_CACHE_DIR environment variable is set, and only for whole-file
+    reads. The file name covers the source path, model class and file stamp,
+    so a changed file gets a new entry.
+
+    Models are pickled, since values of `Any` fields such as variable
+    references do not survive a JSON round trip. A pickle is executable
+    content, so persisting requires POSIX file ownership: see
+    `_is_private_cache_dir` and `_open_private_file`.
+    """
+    cache_dir = os.environ.get(EnvVar.YAML_MODEL_CACHE_DIR.value)
+    if not cache_dir or key[2] is not root_locator or not hasattr(os, "getuid"):
+        return None
+
+    model_class = key[1]
+    class_name = f"{model_class.__module__}.{model_class.__qualname__}"
+    identity = "\0".join((key[0], class_name, *map(str, stamp)))
+    digest = hashlib.sha256(identity.encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir, f"{digest}.pkl")
+
+
+def _is_private_cache_dir(cache_dir: str) -> bool:
+    """
+    Checks that only the current user can add or replace files in `cache_dir`.
+
+    The directory must be owned by the current user and must not be writable
+    by group or others.
+    """
+    try:
+        st = os.stat(cache_dir)
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(st.st_mode)
+        and st.st_uid == os.getuid()
+        and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    )
+
+
+def _open_private_file(path: str) -> int:
+    """
+    Opens a regular file owned by, and only writable by, the current user.
+
+    Symbolic links are not followed, so the checks apply to the file itself.
+
+    Returns:
+        The file descriptor, opened for reading.
+
+    Raises:
+        PermissionError: If the file is not a regular file or fails the checks.
+        OSError: If the file cannot be opened.
+    """
+    fd = os.open(path, os.O_RDONLY | os.O_NOFOLLOW)
+    st = os.fstat(fd)
+    if (
+        not stat.S_ISREG(st.st_mode)
+        or st.st_uid != os.getuid()
+        or st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    ):
+        os.close(fd)
+        raise PermissionError(f"Not a private file of the current user: {path}")
+    return fd
+
+
+def _load_model_sidecar(
+    sidecar: str, model_class: Type[ModelType]
+) -> Optional[ModelType]:
+    """
+    Returns the model persisted at `sidecar`, or None if it is unusable.
+
+    Files are only unpickled from a private cache directory, and only if the
+    current user owns them and nobody else can write them.
+    """
+    if not _is_private_cache_dir(os.path.dirname(sidecar)):
+        logger.warning('Ignoring model cache in unsafe directory "%s"', sidecar)
+        return None
+    try:
+        with os.fdopen(_open_private_file(sidecar), "rb") as file:
+            model = pickle.load(file)
+    except FileNotFoundError:
+        return None
+    except Exception as err:
+        logger.warning('Ignoring unreadable model cache "%s": %s', sidecar, err)
+        return None
+    return model if type(model) is model_class else None
+
+
+def _save_model_sidecar(sidecar: str, model: BaseModel) -> None:
+    """Persists a model at `sidecar`; failures only cost the cache entry."""
+    if not _is_private_cache_dir(os.path.dirname(sidecar)):
+        return
+    tmp_path = f"{sidecar}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        # A new file that only the current user can access, never an existing one
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as file:
+            pickle.dump(model, file, protocol=5)
+        os.replace(tmp_path, sidecar)
+    except OSError as err:
+        logger.warning('Could not write model cache "%s": %s', sidecar, err)
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
 
 def read_model(
     yaml_file_path: Path,
     data_locator: Callable[[Any], Any],
     model_class: Type[ModelType],
     default_value: Any = None,
+    assume_resolved: bool = False,
+    quiet: bool = False,
 ) -> ModelType:
     """
     Read and parse a YAML file into a Pydantic model.
 
+    Validated models are cached and reused while the file's modification time
+    and size are unchanged; callers receive a deep copy. As with `load_yaml`,
+    files that use an include directive are always read again, and so are
+    reads with a `default_value`. If the YAML_MODEL_CACHE_DIR environment
+    variable names a directory, models are also persisted there and reused by
+    later processes.
+
     Args:
         yaml_file_path: Path to the YAML file.
         data_locator: Function to locate the relevant data in the YAML.
         model_class: The Pydantic model class to parse the data into.
         default_value: Default value to use if the data location failed.
+        assume_resolved: Passed on to `load_yaml`.
+        quiet: If True, a missing file is not logged as an error (see `load_yaml`).
 
     Returns:
         An instance of the specified Pydantic model.
@@ -126,11 +354,44 @@ def read_model(
         yaml.YAMLError: If there is an error parsing the YAML file.
         ValidationError: If the data does not match the model schema.
     """
+    if not assume_resolved:
+        yaml_file_path = yaml_file_path.resolve()
+
+    try:
+        st = os.stat(yaml_file_path)
+    except FileNotFoundError as err:
+        if not quiet:
+            logger.error('YAML file reading failed: "%s"', yaml_file_path)
+        raise FileNotFoundError(
+            f"The YAML file '{yaml_file_path}' does not exist."
+        ) from err
+    except OSError:
+        st = None  # reported by load_yaml below
+
+    if st is not None:
+        key = (str(yaml_file_path), model_class, data_locator)
+        stamp = (st.st_mtime_ns, st.st_size)
+        with _cache_lock:
+            cached = _model_cache.get(key)
+            if cached and cached[0] == stamp:
+                _model_cache.move_to_end(key)
+            else:
+                cached = None
+        if cached:
+            return cached[1].model_copy(deep=True)
+
+        sidecar = _model_sidecar_path(key, stamp) if default_value is None else None
+        model = _load_model_sidecar(sidecar, model_class) if sidecar else None
+        if model is not None:
+            _remember_model(key, stamp, model)
+            return model.model_copy(deep=True)
+
     try:
         # Load YAML data
-        yaml_data = load_yaml(yaml_file_path)
+        yaml_data = load_yaml(yaml_file_path, assume_resolved=True, quiet=quiet)
     except FileNotFoundError as err:
-        logger.error('YAML file reading failed: "%s"', yaml_file_path)
+        if not quiet:
+            logger.error('YAML file reading failed: "%s"', yaml_file_path)
         raise FileNotFoundError(
             f"The YAML file '{err.filename}' does not exist."
         ) from err
@@ -146,7 +407,18 @@ def read_model(
     try:
         # Parse and validate the data
         model = model_class.model_validate(model_data)
-        return model
     except ValidationError as e:
         logger.error('Validation error in "%s": %s', yaml_file_path, e)
         raise
+
+    if st is not None and default_value is None:
+        # load_yaml only caches files without includes; an entry with the same
+        # stamp also shows that the file did not change while being read
+        with _cache_lock:
+            yaml_entry = _yaml_cache.get((key[0], tuple(DEFAULT_INCLUDE_CMDS)))
+        if yaml_entry and yaml_entry[0] == stamp:
+            _remember_model(key, stamp, model)
+            if sidecar:
+                _save_model_sidecar(sidecar, model)
+            return model.model_copy(deep=True)
+    return model